@@ -1,9 +1,9 @@
 import os
 import json
-import shutil
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
+from file_organizer_engine import FileOrganizer
 
 DEFAULT_CATEGORIES = {
     "Documents": [".pdf", ".docx", ".txt"],
@@ -156,53 +156,30 @@ class FileOrganizerApp:
         self.save_config()
         self.update_category_list()
 
-    def _categorize_file(self, file_ext):
-        for category, exts in self.categories.items():
-            if file_ext in exts:
-                return category
-        return "Other"
-
-    def _unique_dest(self, dest_dir, name, suffix):
-        counter = 1
-        while (dest_dir / f"{name}_{counter}{suffix}").exists():
-            counter += 1
-        return dest_dir / f"{name}_{counter}{suffix}"
-
     def organize_files(self):
         if not self.selected_folder:
             messagebox.showerror("Error", "Please select a folder first!")
             return
 
+        organizer = FileOrganizer(self.categories, default_folder="Other")
         target_dir = Path(self.selected_folder)
-        files = [f for f in target_dir.iterdir() if f.is_file()]
 
         if self.simulate_var.get():
             counts = {}
-            for f in files:
-                cat = self._categorize_file(f.suffix.lower())
-                counts[cat] = counts.get(cat, 0) + 1
+            for move in organizer.plan(str(target_dir)):
+                counts[move["category"]] = counts.get(move["category"], 0) + 1
             summary = "\n".join(f"Would move {n} files to {c}" for c, n in counts.items()) or "No files would be moved."
             messagebox.showinfo("Simulation", summary)
             return
 
-        for cat in self.categories:
-            (target_dir / cat).mkdir(exist_ok=True)
-
         moved, errors = 0, []
         self.root.config(cursor="wait")
         self.root.update()
 
         try:
-            for item in files:
-                cat = self._categorize_file(item.suffix.lower())
-                dest = target_dir / cat / item.name
-                if dest.exists():
-                    dest = self._unique_dest(target_dir / cat, item.stem, item.suffix)
-                try:
-                    shutil.move(str(item), str(dest))
-                    moved += 1
-                except Exception as e:
-                    errors.append(f"Error moving {item.name}: {e}")
+            report = organizer.organize(str(target_dir))
+            moved = report["moved"]
+            errors = [f"Error moving {Path(e['src']).name}: {e['error']}" for e in report["errors"]]
         except Exception as e:
             messagebox.showerror("Error", f"Fatal error: {e}")
         finally:
@@ -1,8 +1,18 @@
-import pygame
 import sys
+
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Batch mode, e.g. `python "Sudoku game.py" puzzles.txt -j 4` or `--bench`.
+    # alter_sys makes the engine the __main__ that pool workers re-import.
+    # Runs before pygame is imported so its banner never mixes into stdout.
+    import runpy
+    runpy.run_module("sudoku_engine", run_name="__main__", alter_sys=True)
+
+import pygame
 import random
 import time
 import copy
+import sudoku_engine
+from sudoku_engine import PEERS
 
 pygame.init()
 
@@ -32,6 +42,14 @@ small_font = pygame.font.Font(None, FONT_SIZE // 2)
 button_font = pygame.font.Font(None, 36)
 tiny_font = pygame.font.Font(None, 20)
 
+def render_digits(fnt, color):
+    return [None] + [fnt.render(str(d), True, color) for d in range(1, 10)]
+
+# Pre-rendered 1-9 glyphs, indexed by digit
+DIGIT_GLYPHS = {color: render_digits(font, color) for color in (GRAY, GREEN, RED)}
+NOTE_GLYPHS = render_digits(small_font, DARK_BLUE)
+note_surfaces = {}
+
 MENU = 0
 PLAYING = 1
 PAUSED = 2
@@ -44,6 +62,9 @@ MEDIUM = 30
 HARD = 25
 current_difficulty = MEDIUM
 
+# Givens and the hardest solving technique allowed for each difficulty
+puzzle_pool = sudoku_engine.PuzzlePool({EASY: (EASY, "easy"), MEDIUM: (MEDIUM, "medium"), HARD: (HARD, "hard")})
+
 initial_grid = [
     [5, 3, 0, 0, 7, 0, 0, 0, 0],
     [6, 0, 0, 1, 9, 5, 0, 0, 0],
@@ -57,6 +78,7 @@ initial_grid = [
 ]
 
 working_grid = [row[:] for row in initial_grid]
+tracker = sudoku_engine.ConflictTracker(working_grid)
 solution_grid = None
 notes = [[set() for _ in range(9)] for _ in range(9)]
 selected = None
@@ -109,10 +131,10 @@ continue_button = Button(WIDTH//2 - 60, HEIGHT//2 - 30, 120, BUTTON_HEIGHT, "Con
 menu_from_pause = Button(WIDTH//2 - 60, HEIGHT//2 + 40, 120, BUTTON_HEIGHT, "Menu", LIGHT_GRAY, LIGHT_BLUE, lambda: None)
 
 def set_difficulty(difficulty):
-    global current_difficulty, initial_grid, working_grid, solution_grid, selected, game_state, start_time, mistakes, notes, undo_stack, redo_stack, hint_count, game_timer
+    global current_difficulty, initial_grid, solution_grid, selected, game_state, start_time, mistakes, notes, undo_stack, redo_stack, hint_count, game_timer
     current_difficulty = difficulty
     initial_grid, solution_grid = generate_puzzle(difficulty)
-    working_grid = [row[:] for row in initial_grid]
+    load_working_grid([row[:] for row in initial_grid])
     notes = [[set() for _ in range(9)] for _ in range(9)]
     selected = None
     game_state = PLAYING
@@ -125,8 +147,8 @@ def set_difficulty(difficulty):
     statistics["games_played"] += 1
 
 def restart_game():
-    global working_grid, selected, start_time, mistakes, notes, hint_count, undo_stack, redo_stack, game_timer
-    working_grid = [row[:] for row in initial_grid]
+    global selected, start_time, mistakes, notes, hint_count, undo_stack, redo_stack, game_timer
+    load_working_grid([row[:] for row in initial_grid])
     notes = [[set() for _ in range(9)] for _ in range(9)]
     selected = None
     start_time = time.time()
@@ -136,6 +158,15 @@ def restart_game():
     undo_stack = []
     redo_stack = []
 
+def load_working_grid(grid):
+    global working_grid
+    working_grid = grid
+    tracker.reset(grid)
+
+def set_cell(row, col, num):
+    working_grid[row][col] = num
+    tracker.set(row, col, num)
+
 def go_to_menu():
     global game_state
     game_state = MENU
@@ -146,14 +177,14 @@ def toggle_notes():
     note_button.text = "Notes: ON" if note_mode else "Notes: OFF"
 
 def use_hint():
-    global hint_count, working_grid, undo_stack, redo_stack
+    global hint_count, undo_stack, redo_stack
     if hint_count <= 0 or game_state != PLAYING:
         return
     undo_stack.append((copy.deepcopy(working_grid), copy.deepcopy(notes)))
     empty_cells = [(row, col) for row in range(9) for col in range(9) if working_grid[row][col] == 0 and initial_grid[row][col] == 0]
     if empty_cells:
         row, col = random.choice(empty_cells)
-        working_grid[row][col] = solution_grid[row][col]
+        set_cell(row, col, solution_grid[row][col])
         notes[row][col].clear()
         hint_count -= 1
         redo_stack.clear()
@@ -169,94 +200,80 @@ def check_victory():
             statistics["best_time"] = game_timer
 
 def solve_puzzle():
-    global working_grid, game_state, game_timer, undo_stack, redo_stack
+    global notes, game_state, game_timer, undo_stack, redo_stack
     undo_stack.append((copy.deepcopy(working_grid), copy.deepcopy(notes)))
-    working_grid = [row[:] for row in solution_grid]
+    load_working_grid([row[:] for row in solution_grid])
     notes = [[set() for _ in range(9)] for _ in range(9)]
     game_state = VICTORY
     game_timer = time.time() - start_time
     redo_stack.clear()
 
-def draw_grid():
-    screen.fill(WHITE)
+board_surface = None
+board_source = None
+
+def draw_board(grid):
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    surface.fill(WHITE)
     for i in range(10):
         line_width = 3 if i % 3 == 0 else 1
-        pygame.draw.line(screen, BLACK, (i*CELL_SIZE, GRID_ORIGIN), (i*CELL_SIZE, WIDTH), line_width)
-        pygame.draw.line(screen, BLACK, (GRID_ORIGIN, i*CELL_SIZE), (WIDTH, i*CELL_SIZE), line_width)
-
-def get_conflicts(grid):
-    conflicts = set()
+        pygame.draw.line(surface, BLACK, (i*CELL_SIZE, GRID_ORIGIN), (i*CELL_SIZE, WIDTH), line_width)
+        pygame.draw.line(surface, BLACK, (GRID_ORIGIN, i*CELL_SIZE), (WIDTH, i*CELL_SIZE), line_width)
     for row in range(9):
-        num_count = {}
         for col in range(9):
-            num = grid[row][col]
-            if num != 0:
-                if num in num_count:
-                    conflicts.add((row, col))
-                    conflicts.add(num_count[num])
-                else:
-                    num_count[num] = (row, col)
-    for col in range(9):
-        num_count = {}
-        for row in range(9):
-            num = grid[row][col]
-            if num != 0:
-                if num in num_count:
-                    conflicts.add((row, col))
-                    conflicts.add(num_count[num])
-                else:
-                    num_count[num] = (row, col)
-    for box_row in range(0, 9, 3):
-        for box_col in range(0, 9, 3):
-            num_count = {}
-            for row in range(box_row, box_row + 3):
-                for col in range(box_col, box_col + 3):
-                    num = grid[row][col]
-                    if num != 0:
-                        if num in num_count:
-                            conflicts.add((row, col))
-                            conflicts.add(num_count[num])
-                        else:
-                            num_count[num] = (row, col)
-    return conflicts
+            if grid[row][col]:
+                text = DIGIT_GLYPHS[GRAY][grid[row][col]]
+                x = col * CELL_SIZE + (CELL_SIZE - text.get_width()) // 2
+                y = row * CELL_SIZE + (CELL_SIZE - text.get_height()) // 2
+                surface.blit(text, (x, y))
+    return surface
+
+def draw_grid():
+    global board_surface, board_source
+    # Lines and givens only change with a new puzzle, which replaces initial_grid
+    if board_source is not initial_grid:
+        board_surface = draw_board(initial_grid)
+        board_source = initial_grid
+    screen.blit(board_surface, (0, 0))
+
+# The 20 cells sharing a row, column or box with each cell, excluding itself
+RELATED_CELLS = [[tuple(divmod(p, 9) for p in PEERS[row * 9 + col]) for col in range(9)] for row in range(9)]
 
 def get_related_cells(row, col):
-    related = set()
-    for i in range(9):
-        related.add((row, i))
-        related.add((i, col))
-    box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-    for i in range(box_row, box_row + 3):
-        for j in range(box_col, box_col + 3):
-            related.add((i, j))
-    return related
+    return RELATED_CELLS[row][col]
+
+def note_surface(cell_notes):
+    # Surfaces are shared by every cell with the same pencil marks
+    key = frozenset(cell_notes)
+    surface = note_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+        note_size = CELL_SIZE // 3
+        for note_num in key:
+            surface.blit(NOTE_GLYPHS[note_num], (((note_num-1) % 3) * note_size + 5, ((note_num-1) // 3) * note_size + 5))
+        note_surfaces[key] = surface
+    return surface
 
 def draw_numbers():
-    conflicts = get_conflicts(working_grid)
+    check_conflicts = tracker.clashes > 0
     for row in range(9):
         for col in range(9):
-            if (row, col) in conflicts:
+            if check_conflicts and tracker.is_conflict(row, col):
                 pygame.draw.rect(screen, RED, (col*CELL_SIZE, row*CELL_SIZE, CELL_SIZE, CELL_SIZE), 3)
             
+            if initial_grid[row][col] != 0:
+                continue
             num = working_grid[row][col]
             if num != 0:
-                is_original = initial_grid[row][col] != 0
                 is_correct = solution_grid[row][col] == num if solution_grid else True
-                color = GRAY if is_original else (GREEN if is_correct else RED)
-                text = font.render(str(num), True, color)
+                color = GREEN if is_correct else RED
+                text = DIGIT_GLYPHS[color][num]
                 x = col * CELL_SIZE + (CELL_SIZE - text.get_width()) // 2
                 y = row * CELL_SIZE + (CELL_SIZE - text.get_height()) // 2
                 screen.blit(text, (x, y))
             else:
                 cell_notes = notes[row][col]
                 if cell_notes:
-                    note_size = CELL_SIZE // 3
-                    for note_num in range(1, 10):
-                        if note_num in cell_notes:
-                            note_text = small_font.render(str(note_num), True, DARK_BLUE)
-                            note_x = col * CELL_SIZE + ((note_num-1) % 3) * note_size + 5
-                            note_y = row * CELL_SIZE + ((note_num-1) // 3) * note_size + 5
-                            screen.blit(note_text, (note_x, note_y))
+                    screen.blit(note_surface(cell_notes), (col * CELL_SIZE, row * CELL_SIZE))
 
 def draw_selection():
     if selected:
@@ -265,10 +282,8 @@ def draw_selection():
                          (col*CELL_SIZE, row*CELL_SIZE, CELL_SIZE, CELL_SIZE), 3)
         
         if show_related_cells:
-            related = get_related_cells(row, col)
-            for r, c in related:
-                if (r, c) != (row, col):
-                    pygame.draw.rect(screen, LIGHT_YELLOW, (c*CELL_SIZE, r*CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+            for r, c in get_related_cells(row, col):
+                pygame.draw.rect(screen, LIGHT_YELLOW, (c*CELL_SIZE, r*CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
 
 def draw_ui():
     if game_state == PLAYING:
@@ -326,55 +341,25 @@ def draw_menu():
             screen.blit(best_text, (20, stats_y + 50))
 
 def can_place(grid, row, col, num):
-    for x in range(9):
-        if grid[row][x] == num or grid[x][col] == num:
-            return False
-    start_row, start_col = 3*(row//3), 3*(col//3)
-    for i in range(start_row, start_row+3):
-        for j in range(start_col, start_col+3):
-            if grid[i][j] == num:
-                return False
-    return True
+    if grid[row][col] == num:
+        return False
+    return all(grid[p // 9][p % 9] != num for p in PEERS[row * 9 + col])
 
 def solve_sudoku(grid):
-    empty = find_empty(grid)
-    if not empty:
-        return True
-    row, col = empty
-    nums = list(range(1, 10))
-    random.shuffle(nums)
-    for num in nums:
-        if can_place(grid, row, col, num):
-            grid[row][col] = num
-            if solve_sudoku(grid):
-                return True
-            grid[row][col] = 0
-    return False
-
-def find_empty(grid):
-    for i in range(9):
-        for j in range(9):
-            if grid[i][j] == 0:
-                return (i, j)
-    return None
+    solution = sudoku_engine.solve(sudoku_engine.from_grid(grid), random)
+    if solution is None:
+        return False
+    for row in range(9):
+        grid[row][:] = solution[row * 9:row * 9 + 9]
+    return True
 
 def generate_puzzle(difficulty):
-    grid = [[0 for _ in range(9)] for _ in range(9)]
-    solve_sudoku(grid)
-    solution = [row[:] for row in grid]
-    cells = [(i, j) for i in range(9) for j in range(9)]
-    random.shuffle(cells)
-    cells_to_keep = difficulty
-    for i, j in cells[cells_to_keep:]:
-        grid[i][j] = 0
-    return grid, solution
+    puzzle, solution, grade = puzzle_pool.get(difficulty)
+    pygame.display.set_caption(f"Enhanced Sudoku - {grade.capitalize()}")
+    return sudoku_engine.to_grid(puzzle), sudoku_engine.to_grid(solution)
 
 def is_solved():
-    for row in range(9):
-        for col in range(9):
-            if working_grid[row][col] == 0:
-                return False
-    return True
+    return tracker.is_solved()
 
 def show_victory():
     minutes, seconds = int(game_timer // 60), int(game_timer % 60)
@@ -398,7 +383,7 @@ def show_pause_menu():
     menu_from_pause.draw()
 
 initial_grid, solution_grid = generate_puzzle(current_difficulty)
-working_grid = [row[:] for row in initial_grid]
+load_working_grid([row[:] for row in initial_grid])
 
 running = True
 clock = pygame.time.Clock()
@@ -488,7 +473,7 @@ while running:
                     if event.key == pygame.K_BACKSPACE or event.key == pygame.K_DELETE:
                         if working_grid[row][col] != 0:
                             undo_stack.append((copy.deepcopy(working_grid), copy.deepcopy(notes)))
-                            working_grid[row][col] = 0
+                            set_cell(row, col, 0)
                             notes[row][col].clear()
                             redo_stack.clear()
                     else:
@@ -512,15 +497,10 @@ while running:
                                     notes[row][col].add(num)
                             else:
                                 if solution_grid[row][col] == num:
-                                    working_grid[row][col] = num
+                                    set_cell(row, col, num)
                                     notes[row][col].clear()
-                                    for i in range(9):
-                                        notes[row][i].discard(num)
-                                        notes[i][col].discard(num)
-                                    box_row, box_col = 3*(row//3), 3*(col//3)
-                                    for i in range(box_row, box_row+3):
-                                        for j in range(box_col, box_col+3):
-                                            notes[i][j].discard(num)
+                                    for r, c in RELATED_CELLS[row][col]:
+                                        notes[r][c].discard(num)
                                     check_victory()
                                 else:
                                     mistakes += 1
@@ -548,10 +528,12 @@ while running:
                     toggle_notes()
                 elif event.key == pygame.K_u and undo_stack:
                     redo_stack.append((copy.deepcopy(working_grid), copy.deepcopy(notes)))
-                    working_grid, notes = undo_stack.pop()
+                    grid, notes = undo_stack.pop()
+                    load_working_grid(grid)
                 elif event.key == pygame.K_r and redo_stack:
                     undo_stack.append((copy.deepcopy(working_grid), copy.deepcopy(notes)))
-                    working_grid, notes = redo_stack.pop()
+                    grid, notes = redo_stack.pop()
+                    load_working_grid(grid)
     
     if game_state == MENU:
         draw_menu()
@@ -0,0 +1,120 @@
+"""Terminal input and output for the text adventure.
+
+Console collects everything the game prints and writes it in one go when
+the game next waits for the player, instead of one write per line (and a
+flush per character for the typewriter effect).  The typewriter writes
+whatever characters are due every FRAME seconds, and both it and pause()
+end early when the player presses Enter.
+
+Fast mode turns off every delay and clears the screen with an ANSI escape
+instead of running cls/clear.  Given a script (an iterable of lines), the
+console answers the game's prompts from it instead of the keyboard, and
+"Press Enter" prompts stop waiting, so a playthrough can run unattended.
+"""
+
+import os
+import sys
+import time
+
+CLEAR = "\033[2J\033[H"
+FRAME = 0.05  # seconds between typewriter writes
+SCRIPT_FLUSH_LINES = 256  # buffered lines before a scripted run writes them out
+
+
+class Console:
+    def __init__(self, out=None, typing_delay=0.03, fast=False, script=None):
+        self.out = out or sys.stdout
+        self.typing_delay = typing_delay
+        self.fast = fast
+        self.script = None if script is None else iter(script)
+        self.interactive = script is None and sys.stdin.isatty()
+        self.buffer = []
+        self.commands = 0  # lines read from the script
+        self.writes = 0
+
+    def print(self, *args, sep=" ", end="\n"):
+        self.buffer.append(sep.join(map(str, args)) + end)
+
+    def flush(self):
+        if self.buffer:
+            self.out.write("".join(self.buffer))
+            self.buffer.clear()
+            self.writes += 1
+        self.out.flush()
+
+    def clear(self):
+        if self.fast:
+            self.buffer.append(CLEAR)
+        else:
+            self.flush()
+            os.system('cls' if os.name == 'nt' else 'clear')
+
+    def pause(self, secs=1.5):
+        if not self.fast:
+            self.flush()
+            self.wait_for_enter(secs)
+
+    def typewrite(self, text):
+        """Print text a character at a time at the configured typing speed."""
+        if self.fast or self.typing_delay <= 0:
+            self.print(text)
+            return
+        self.flush()
+        start = time.monotonic()
+        shown = 0
+        while shown < len(text):
+            due = min(len(text), int((time.monotonic() - start) / self.typing_delay) + 1)
+            if due > shown:
+                self.out.write(text[shown:due])
+                self.out.flush()
+                shown = due
+            if shown < len(text) and self.wait_for_enter(FRAME):
+                break
+        self.out.write(text[shown:] + "\n")
+        self.out.flush()
+
+    def wait_for_enter(self, timeout):
+        """Sleep up to timeout seconds; True (and the keypress consumed) if Enter was pressed."""
+        if not self.interactive:
+            time.sleep(timeout)
+            return False
+        if os.name == 'nt':
+            import msvcrt
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if msvcrt.kbhit():
+                    while msvcrt.kbhit():
+                        msvcrt.getwch()
+                    return True
+                time.sleep(0.02)
+            return False
+        import select
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if ready:
+            sys.stdin.readline()
+            return True
+        return False
+
+    def input(self, prompt=""):
+        if self.script is None:
+            self.print(prompt, end="")
+            self.flush()
+            return input()
+        for line in self.script:
+            line = line.rstrip("\r\n")
+            if not line.lstrip().startswith("#"):
+                break
+        else:
+            raise EOFError
+        self.commands += 1
+        self.print(prompt + line)
+        if len(self.buffer) > SCRIPT_FLUSH_LINES:
+            self.flush()
+        return line
+
+    def wait(self, prompt):
+        """A "Press Enter" prompt; scripted runs carry straight on."""
+        if self.script is None:
+            self.input(prompt)
+        else:
+            self.print(prompt)
@@ -0,0 +1,74 @@
+"""Save slots for the text adventure.
+
+A save is one JSON document, gzip-compressed by default and recognised by
+its magic bytes when read back, so compressed and plain saves load the
+same way.  Writes go to a temporary file that is fsynced and then renamed
+over the slot, so a crash mid-save never leaves a half-written slot.
+Each world has its own set of named slots in SAVE_DIR.
+"""
+
+import os
+import re
+import gzip
+import json
+import time
+
+VERSION = 2
+SAVE_DIR = "adventure_saves"
+QUICK_SLOT = "quick"
+SLOT_NAME = re.compile(r"[a-z0-9_-]{1,16}")
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def valid_slot(slot):
+    return bool(SLOT_NAME.fullmatch(slot))
+
+
+def slot_path(world, slot, directory=SAVE_DIR):
+    return os.path.join(directory, f"{world}-{slot}.sav")
+
+
+def write(path, data, compress=True):
+    """Atomically replace path with data; returns the number of bytes written."""
+    payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if compress:
+        payload = gzip.compress(payload, mtime=0)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return len(payload)
+
+
+def read(path):
+    with open(path, "rb") as f:
+        payload = f.read()
+    if payload.startswith(GZIP_MAGIC):
+        payload = gzip.decompress(payload)
+    data = json.loads(payload)
+    if data.get("version", 1) > VERSION:
+        raise ValueError(f"save format {data['version']} is newer than this game ({VERSION})")
+    return data
+
+
+def list_slots(world, directory=SAVE_DIR):
+    """[(slot, modified time)] for the world's saves, newest first."""
+    prefix = f"{world}-"
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    slots = []
+    for name in names:
+        if name.startswith(prefix) and name.endswith(".sav"):
+            slots.append((name[len(prefix):-4], os.path.getmtime(os.path.join(directory, name))))
+    return sorted(slots, key=lambda slot: slot[1], reverse=True)
+
+
+def describe_time(mtime):
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime))
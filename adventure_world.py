@@ -0,0 +1,290 @@
+"""World files and the compiled world graph for the text adventure.
+
+A world is written as one JSON document (see adventure_worlds/dungeon.json)
+holding its items, monsters and rooms.  That is fine for small worlds, but
+a big one can be compiled into an indexed .world file: a JSON header line
+with the items, monsters, room keys and byte offsets, then one JSON line
+per room whose exits are already room ids.  Opening a .world file reads
+only the header; a room is parsed the first time it is needed and kept in
+a small LRU cache.
+
+    python adventure_world.py build adventure_worlds/dungeon.json dungeon.world
+    python adventure_world.py generate 5000 maze.world
+
+Room keys are interned to ints, and a room's exits are an array indexed
+by direction, so following an exit is a single array lookup.
+"""
+
+import os
+import sys
+import json
+import math
+import random
+import argparse
+from array import array
+from collections import OrderedDict
+
+FORMAT = "adventure-world"
+VERSION = 1
+DIRECTIONS = ("north", "south", "east", "west", "up", "down")
+DIRECTION_IDS = {d: i for i, d in enumerate(DIRECTIONS)}
+DIRECTION_ALIASES = {d[0]: d for d in DIRECTIONS}
+NO_EXIT = -1
+CACHE_SIZE = 256  # parsed rooms, and unchanged room states, kept in memory
+
+
+def direction_of(word):
+    """Full direction name for "north" or "n", else None."""
+    word = DIRECTION_ALIASES.get(word, word)
+    return word if word in DIRECTION_IDS else None
+
+
+# ----- Loading and building world files -----
+def compile_rooms(rooms):
+    """(keys, records) with each record's exits turned into a list of room ids."""
+    keys = list(rooms)
+    ids = {key: i for i, key in enumerate(keys)}
+    records = []
+    for key in keys:
+        record = dict(rooms[key])
+        exits = [NO_EXIT] * len(DIRECTIONS)
+        for direction, dest in record.get("exits", {}).items():
+            if direction not in DIRECTION_IDS or dest not in ids:
+                raise ValueError(f"Room {key!r} has a bad exit {direction} -> {dest!r}")
+            exits[DIRECTION_IDS[direction]] = ids[dest]
+        record["exits"] = exits
+        record["items"] = record.get("items", [])
+        records.append(record)
+    return keys, records
+
+
+def _check_header(header, path):
+    if header.get("format") != FORMAT or header.get("version", 0) > VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} world file")
+
+
+def load(path, cache_size=CACHE_SIZE):
+    """Open a world from a .json source or an indexed .world file."""
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            source = json.load(f)
+        _check_header(source, path)
+        keys, records = compile_rooms(source["rooms"])
+        return World(source, keys, lambda rid: dict(records[rid]), cache_size)
+
+    f = open(path, "rb")
+    header = json.loads(f.readline())
+    _check_header(header, path)
+    base = f.tell()
+    offsets = header["offsets"]
+
+    def read(rid):
+        f.seek(base + offsets[rid])
+        return json.loads(f.readline())
+
+    world = World(header, header["rooms"], read, cache_size)
+    world.file = f
+    return world
+
+
+def build(source, path):
+    """Write a source world dict as an indexed .world file."""
+    keys, records = compile_rooms(source["rooms"])
+    lines = [json.dumps(r, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+             for r in records]
+    offsets = []
+    pos = 0
+    for line in lines:
+        offsets.append(pos)
+        pos += len(line)
+    header = {
+        "format": FORMAT,
+        "version": VERSION,
+        "name": source.get("name", os.path.splitext(os.path.basename(path))[0]),
+        "start": source["start"],
+        "items": source.get("items", {}),
+        "monsters": source.get("monsters", {}),
+        "rooms": keys,
+        "offsets": offsets,
+    }
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n")
+        f.writelines(lines)
+    os.replace(tmp, path)
+
+
+def generate(count, template, seed=0):
+    """A source world with count rooms in a grid, using template's items and monsters."""
+    rng = random.Random(seed)
+    width = max(1, math.isqrt(count))
+    items = list(template["items"])
+    monsters = [m for m in template["monsters"] if m != "dragon"]
+    rooms = {}
+    for i in range(count):
+        row, col = divmod(i, width)
+        exits = {}
+        # Every row is a corridor and the first column joins the rows, so
+        # all rooms are reachable; the other north/south links are random
+        if col > 0:
+            exits["west"] = f"room_{i - 1}"
+        if col < width - 1 and i + 1 < count:
+            exits["east"] = f"room_{i + 1}"
+        if row > 0 and (col == 0 or rng.random() < 0.5):
+            exits["north"] = f"room_{i - width}"
+            rooms[f"room_{i - width}"]["exits"]["south"] = f"room_{i}"
+        room = {
+            "name": f"Chamber {row + 1}-{col + 1}",
+            "description": "A bare stone chamber. Passages lead off into the dark.",
+            "exits": exits,
+            "items": rng.sample(items, rng.randint(0, 2)),
+            "first_visit": True,
+            "dark": rng.random() < 0.1,
+        }
+        if rng.random() < 0.2:
+            room["monster_spawn"] = rng.choice(monsters)
+            room["monster_spawn_chance"] = 0.5
+        rooms[f"room_{i}"] = room
+    rooms["room_0"]["exits"]["south"] = "outside"
+    rooms["outside"] = {
+        "name": "Outside the Dungeon",
+        "description": "You emerge into the open air.",
+        "exits": {"north": "room_0"},
+        "items": [],
+        "first_visit": True,
+        "dark": False,
+        "is_exit": True,
+    }
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "name": f"maze-{count}-{seed}",
+        "start": "room_0",
+        "items": template["items"],
+        "monsters": template["monsters"],
+        "rooms": rooms,
+    }
+
+
+# ----- World -----
+class World:
+    def __init__(self, info, keys, read, cache_size=CACHE_SIZE):
+        self.name = info.get("name")
+        self.items = info.get("items", {})
+        self.monsters = info.get("monsters", {})
+        self.keys = keys
+        self.ids = {key: i for i, key in enumerate(keys)}
+        self.start = self.ids[info["start"]]
+        self.cache_size = cache_size
+        self.file = None
+        self._read = read
+        self.records = OrderedDict()  # room id -> pristine record, LRU order
+        self.changed = {}  # room id -> room dict the game has written to; never evicted
+        self.clean = OrderedDict()  # room id -> unchanged room dict, LRU order
+        self.reads = 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+
+    def record(self, rid):
+        """The pristine room record; treat it as read-only."""
+        record = self.records.get(rid)
+        if record is None:
+            record = self._read(rid)
+            record["exits"] = array("i", record["exits"])
+            self.reads += 1
+            self.records[rid] = record
+            if len(self.records) > self.cache_size:
+                self.records.popitem(last=False)
+        else:
+            self.records.move_to_end(rid)
+        return record
+
+    def room(self, rid, write=False):
+        """The room's dict, copied from the pristine record on first use.
+
+        Pass write=True before changing it: that marks the room changed for
+        good, while rooms only read stay in an LRU and may be dropped.
+        """
+        room = self.changed.get(rid)
+        if room is not None:
+            return room
+        room = self.clean.pop(rid, None)
+        if room is None:
+            room = dict(self.record(rid))
+            room["items"] = list(room["items"])
+            if "locked_chest" in room:
+                chest = dict(room["locked_chest"])
+                chest["items"] = list(chest["items"])
+                room["locked_chest"] = chest
+        if write:
+            self.changed[rid] = room
+        else:
+            self.clean[rid] = room
+            if len(self.clean) > self.cache_size:
+                self.clean.popitem(last=False)
+        return room
+
+    def exit(self, rid, direction):
+        """Room id through the exit, or NO_EXIT."""
+        return self.record(rid)["exits"][DIRECTION_IDS[direction]]
+
+    def exits_of(self, rid):
+        """[(direction, room id)] for the room's open exits."""
+        exits = self.record(rid)["exits"]
+        return [(d, exits[i]) for i, d in enumerate(DIRECTIONS) if exits[i] != NO_EXIT]
+
+    def diff(self):
+        """{room key: {field: value}} for every field that differs from the pristine world."""
+        changes = {}
+        for rid, room in self.changed.items():
+            record = self.record(rid)
+            fields = {k: v for k, v in room.items() if record.get(k) != v}
+            if fields:
+                changes[self.keys[rid]] = fields
+        return changes
+
+    def apply(self, changes):
+        """Reset to the pristine world, then apply a diff() result."""
+        self.changed.clear()
+        self.clean.clear()
+        for key, fields in changes.items():
+            if key in self.ids:
+                self.room(self.ids[key], write=True).update(fields)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build text adventure world files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_cmd = commands.add_parser("build", help="compile a .json world into an indexed .world file")
+    build_cmd.add_argument("source")
+    build_cmd.add_argument("output")
+    gen_cmd = commands.add_parser("generate", help="write a large grid world for testing")
+    gen_cmd.add_argument("rooms", type=int)
+    gen_cmd.add_argument("output")
+    gen_cmd.add_argument("--template", default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                            "adventure_worlds", "dungeon.json"),
+                         help="world to take items and monsters from")
+    gen_cmd.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        with open(args.source, encoding="utf-8") as f:
+            source = json.load(f)
+    else:
+        with open(args.template, encoding="utf-8") as f:
+            source = generate(args.rooms, json.load(f), args.seed)
+    if args.output.endswith(".json"):
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(source, f, indent=2, ensure_ascii=False)
+    else:
+        build(source, args.output)
+    print(f"Wrote {len(source['rooms'])} rooms to {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,6 @@
 import os
 import json
 import shutil
-import fnmatch
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
@@ -11,6 +10,7 @@ from watchdog.events import FileSystemEventHandler
 import threading
 import time
 import queue
+from file_organizer_engine import DEFAULT_CONFIG, FileOrganizer
 
 class EnhancedFileOrganizer(TkinterDnD.Tk):
     def __init__(self):
@@ -154,18 +154,8 @@ class EnhancedFileOrganizer(TkinterDnD.Tk):
 
     def load_config(self):
         defaults = {
-            "categories": {
-                "Documents": [".pdf", ".docx", ".txt", ".doc"],
-                "Images": [".jpg", ".png", ".gif", ".jpeg", ".bmp"],
-                "Audio": [".mp3", ".wav", ".flac", ".aac"],
-                "Videos": [".mp4", ".avi", ".mov", ".mkv"],
-                "Archives": [".zip", ".rar", ".7z", ".tar"],
-                "Code": [".py", ".js", ".html", ".css", ".java"],
-                "Executables": [".exe", ".msi", ".bat"]
-            },
-            "default_folder": "Other",
-            "move_unmatched": True,
-            "exclude_patterns": ["*.tmp", "*.bak", "*.log", "desktop.ini"],
+            **DEFAULT_CONFIG,
+            "categories": dict(DEFAULT_CONFIG["categories"]),
             "theme": "light",
             "recent_folders": []
         }
@@ -315,34 +305,24 @@ class EnhancedFileOrganizer(TkinterDnD.Tk):
         self.log_text.see(tk.END)
         self.log_text.config(state="disabled")
 
+    def build_organizer(self):
+        # Snapshot the current widget state into a headless engine
+        return FileOrganizer(
+            self.config["categories"],
+            default_folder=self.config["default_folder"],
+            move_unmatched=self.move_unmatched.get(),
+            exclude_patterns=self.exclude_entry.get().split(","),
+            rules=self.config.get("rules"),
+        )
+
     def get_category_for_file(self, filename):
-        _, file_ext = os.path.splitext(filename.lower())
-        for category, extensions in self.config["categories"].items():
-            if file_ext in extensions:
-                return category
-        return self.config["default_folder"] if self.move_unmatched.get() else None
+        return self.build_organizer().get_category_for_file(filename)
 
     def is_excluded(self, filename):
-        exclude_patterns = [x.strip() for x in self.exclude_entry.get().split(",") if x.strip()]
-        return any(fnmatch.fnmatch(filename.lower(), pattern.lower()) for pattern in exclude_patterns)
+        return self.build_organizer().is_excluded(filename)
 
     def collect_files(self, directory):
-        file_map = {cat: [] for cat in self.config["categories"]}
-        file_map[self.config["default_folder"]] = []
-        total_files = 0
-        
-        for root, _, files in os.walk(directory):
-            if root == directory:  # Only process files in the root directory
-                for filename in files:
-                    if self.is_excluded(filename):
-                        continue
-                    filepath = os.path.join(root, filename)
-                    category = self.get_category_for_file(filename)
-                    if category:
-                        file_map[category].append(filepath)
-                        total_files += 1
-                        
-        return file_map, total_files
+        return self.build_organizer().collect_files(directory)
 
     def search_files(self, event=None):
         search_term = self.search_entry.get().lower()
@@ -416,50 +396,33 @@ class EnhancedFileOrganizer(TkinterDnD.Tk):
             
         self.redo_stack.clear()
         self.log_message("Starting file organization...")
-        file_map, total_files = self.collect_files(self.selected_folder)
+        organizer = self.build_organizer()
+        moves = organizer.plan(self.selected_folder)
         
-        if not total_files:
+        if not moves:
             messagebox.showinfo("Organize", "No files to organize")
             return
             
-        undo_info = {"timestamp": time.time(), "moves": []}
-        self.progress["maximum"] = total_files
-        processed = 0
+        self.progress["maximum"] = len(moves)
         
-        for category, files in file_map.items():
-            if not files:
-                continue
-            category_path = os.path.join(self.selected_folder, category)
-            os.makedirs(category_path, exist_ok=True)
-            
-            for filepath in files:
-                filename = os.path.basename(filepath)
-                dest_path = os.path.join(category_path, filename)
-                
-                # Handle duplicates
-                base, ext = os.path.splitext(filename)
-                counter = 1
-                while os.path.exists(dest_path):
-                    new_filename = f"{base}_{counter}{ext}"
-                    dest_path = os.path.join(category_path, new_filename)
-                    counter += 1
-                
-                try:
-                    shutil.move(filepath, dest_path)
-                    undo_info["moves"].append({"src": dest_path, "dest": filepath})
-                    self.log_message(f"Moved: {filename} -> {category}")
-                except Exception as e:
-                    self.log_message(f"Error moving {filename}: {str(e)}")
-                
-                processed += 1
-                self.progress["value"] = processed
-                self.update_idletasks()
+        def on_progress(processed, total, move, error):
+            filename = os.path.basename(move["src"])
+            if error:
+                self.log_message(f"Error moving {filename}: {error}")
+            else:
+                self.log_message(f"Moved: {filename} -> {move['category']}")
+            self.progress["value"] = processed
+            self.update_idletasks()
+        
+        done, _ = organizer.apply_moves(moves, on_progress)
+        undo_info = {"timestamp": time.time(),
+                     "moves": [{"src": m["dest"], "dest": m["src"]} for m in reversed(done)]}
         
         self.undo_stack.append(undo_info)
         self.progress["value"] = 0
         self.update_category_tree()
-        messagebox.showinfo("Complete", f"Organized {processed} files into {len([c for c in file_map if file_map[c]])} categories")
-        self.log_message(f"Organization complete: {processed} files")
+        messagebox.showinfo("Complete", f"Organized {len(moves)} files into {len({m['category'] for m in moves})} categories")
+        self.log_message(f"Organization complete: {len(moves)} files")
 
     def undo_last(self):
         if not self.undo_stack:
@@ -470,26 +433,22 @@ class EnhancedFileOrganizer(TkinterDnD.Tk):
             return
             
         undo_info = self.undo_stack.pop()
-        redo_info = {"timestamp": time.time(), "moves": []}
         moves = undo_info["moves"]
-        
         self.progress["maximum"] = len(moves)
-        success_count = 0
         
-        for i, move in enumerate(moves):
-            src, dest = move["src"], move["dest"]
-            try:
-                os.makedirs(os.path.dirname(dest), exist_ok=True)
-                shutil.move(src, dest)
-                redo_info["moves"].append({"src": dest, "dest": src})
-                self.log_message(f"Restored: {os.path.basename(src)} -> {os.path.dirname(dest)}")
-                success_count += 1
-            except Exception as e:
-                self.log_message(f"Undo error: {str(e)}")
-                
-            self.progress["value"] = i + 1
+        def on_progress(processed, total, move, error):
+            if error:
+                self.log_message(f"Undo error: {error}")
+            else:
+                self.log_message(f"Restored: {os.path.basename(move['src'])} -> {os.path.dirname(move['dest'])}")
+            self.progress["value"] = processed
             self.update_idletasks()
         
+        done, _ = self.build_organizer().apply_moves(moves, on_progress)
+        success_count = len(done)
+        redo_info = {"timestamp": time.time(),
+                     "moves": [{"src": m["dest"], "dest": m["src"]} for m in reversed(done)]}
+        
         self.redo_stack.append(redo_info)
         self.cleanup_empty_dirs()
         self.progress["value"] = 0
@@ -506,26 +465,22 @@ class EnhancedFileOrganizer(TkinterDnD.Tk):
             return
             
         redo_info = self.redo_stack.pop()
-        undo_info = {"timestamp": time.time(), "moves": []}
         moves = redo_info["moves"]
-        
         self.progress["maximum"] = len(moves)
-        success_count = 0
         
-        for i, move in enumerate(moves):
-            src, dest = move["src"], move["dest"]
-            try:
-                os.makedirs(os.path.dirname(dest), exist_ok=True)
-                shutil.move(src, dest)
-                undo_info["moves"].append({"src": dest, "dest": src})
-                self.log_message(f"Redone: {os.path.basename(src)} -> {os.path.dirname(dest)}")
-                success_count += 1
-            except Exception as e:
-                self.log_message(f"Redo error: {str(e)}")
-                
-            self.progress["value"] = i + 1
+        def on_progress(processed, total, move, error):
+            if error:
+                self.log_message(f"Redo error: {error}")
+            else:
+                self.log_message(f"Redone: {os.path.basename(move['src'])} -> {os.path.dirname(move['dest'])}")
+            self.progress["value"] = processed
             self.update_idletasks()
         
+        done, _ = self.build_organizer().apply_moves(moves, on_progress)
+        success_count = len(done)
+        undo_info = {"timestamp": time.time(),
+                     "moves": [{"src": m["dest"], "dest": m["src"]} for m in reversed(done)]}
+        
         self.undo_stack.append(undo_info)
         self.cleanup_empty_dirs()
         self.progress["value"] = 0
@@ -536,14 +491,8 @@ class EnhancedFileOrganizer(TkinterDnD.Tk):
     def cleanup_empty_dirs(self):
         if not self.selected_folder:
             return
-        for category in list(self.config["categories"].keys()) + [self.config["default_folder"]]:
-            path = os.path.join(self.selected_folder, category)
-            if os.path.exists(path) and not os.listdir(path):
-                try:
-                    os.rmdir(path)
-                    self.log_message(f"Removed empty directory: {category}")
-                except:
-                    pass
+        for category in self.build_organizer().cleanup_empty_dirs(self.selected_folder):
+            self.log_message(f"Removed empty directory: {category}")
 
     def toggle_monitoring(self):
         if self.monitor_var.get():
@@ -594,8 +543,9 @@ class EnhancedFileOrganizer(TkinterDnD.Tk):
             while True:
                 event_type, path = self.monitor_queue.get_nowait()
                 if event_type == "created" and os.path.isfile(path):
-                    category = self.get_category_for_file(os.path.basename(path))
-                    if category and not self.is_excluded(os.path.basename(path)):
+                    organizer = self.build_organizer()
+                    category = organizer.get_category_for_file(os.path.basename(path), path)
+                    if category and not organizer.is_excluded(os.path.basename(path)):
                         dest_path = os.path.join(self.selected_folder, category, os.path.basename(path))
                         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
                         try:
@@ -0,0 +1,140 @@
+"""Throughput benchmark for file_organizer_engine.
+
+Builds a synthetic directory in a temp folder, then times scan, classify,
+plan, move and undo.  Both Tk apps organize through the engine, so these
+numbers cover them as well.
+
+    python file_organizer_bench.py --files 50000 --collisions 0.2 --workers 1 8
+
+--memory traces each stage's own peak Python heap with tracemalloc, which
+slows every stage down; max_rss_mb is the process high-water mark so far,
+so it only ever grows from one stage to the next.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+from file_organizer_engine import DEFAULT_CONFIG, FileOrganizer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_MIX = "pdf:3,txt:5,jpg:6,png:4,mp3:2,mp4:1,zip:1,py:3,xyz:2"
+
+
+def max_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        ext, _, weight = part.partition(":")
+        mix["." + ext.strip().lstrip(".")] = float(weight or 1)
+    return mix
+
+
+def generate_tree(root, files, mix, collisions, depth=0, seed=0):
+    """Create empty files under root; a fraction already exist in their category folder."""
+    rng = random.Random(seed)
+    organizer = FileOrganizer(DEFAULT_CONFIG["categories"])
+    exts, weights = list(mix), list(mix.values())
+    subdirs = [root] + [os.path.join(root, f"sub{i}") for i in range(depth)]
+    for folder in subdirs:
+        os.makedirs(folder, exist_ok=True)
+    for i in range(files):
+        ext = rng.choices(exts, weights)[0]
+        name = f"file_{i}{ext}"
+        open(os.path.join(rng.choice(subdirs), name), "w").close()
+        if rng.random() < collisions:
+            category_dir = os.path.join(root, organizer.get_category_for_file(name))
+            os.makedirs(category_dir, exist_ok=True)
+            open(os.path.join(category_dir, name), "w").close()
+
+
+def timed(results, stage, count, func):
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    value = func()
+    elapsed = time.perf_counter() - started
+    results.append({
+        "stage": stage,
+        "files": count,
+        "seconds": round(elapsed, 4),
+        "files_per_sec": round(count / elapsed) if elapsed else None,
+        "peak_mb": round((tracemalloc.get_traced_memory()[1] - base) / 2 ** 20, 1) if tracing else None,
+        "max_rss_mb": max_rss_mb(),
+    })
+    return value
+
+
+def run(args, workers):
+    config = DEFAULT_CONFIG
+    if args.rules:
+        with open(args.rules) as f:
+            config = {**DEFAULT_CONFIG, "rules": json.load(f)}
+    root = tempfile.mkdtemp(prefix="organizer_bench_")
+    results = []
+    try:
+        timed(results, "generate", args.files, lambda: generate_tree(
+            root, args.files, parse_mix(args.mix), args.collisions, args.depth, args.seed))
+        organizer = FileOrganizer.from_config(config, recursive=args.depth > 0, workers=workers)
+        entries = timed(results, "scan", args.files, lambda: list(organizer.scan(root)))
+        timed(results, "classify", len(entries), lambda: organizer.collect_files(root))
+        moves = timed(results, "plan", len(entries), lambda: organizer.plan(root))
+        done, _ = timed(results, "move", len(moves), lambda: organizer.apply_moves(moves))
+        timed(results, "undo", len(done), lambda: organizer.undo(done))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the file organizer engine.")
+    parser.add_argument("--files", type=int, default=10000, help="number of files to generate")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="extension:weight list")
+    parser.add_argument("--collisions", type=float, default=0.1,
+                        help="fraction of names already taken in their category folder")
+    parser.add_argument("--depth", type=int, default=0,
+                        help="number of subdirectories (enables recursive mode)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1], help="move worker counts to try")
+    parser.add_argument("--rules", metavar="FILE", help="JSON rule list to classify with")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", action="store_true",
+                        help="measure each stage's peak heap (slower)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        tracemalloc.start()
+    report = {str(workers): run(args, workers) for workers in args.workers}
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'workers':>7} {'stage':<9} {'files':>8} {'seconds':>9} {'files/s':>10} "
+          f"{'peak MB':>8} {'max RSS':>8}")
+    for workers, results in report.items():
+        for row in results:
+            peak = "-" if row["peak_mb"] is None else row["peak_mb"]
+            print(f"{workers:>7} {row['stage']:<9} {row['files']:>8} {row['seconds']:>9.4f} "
+                  f"{row['files_per_sec'] or '-':>10} {peak:>8} {row['max_rss_mb'] or '-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""Headless file organizing engine shared by the Tk front-ends.
+
+Run ``python -m file_organizer_engine --help`` to organize from cron or a
+shell without a display.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import fnmatch
+import argparse
+from pathlib import Path
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from file_organizer_rules import RuleSet
+
+DEFAULT_CONFIG = {
+    "categories": {
+        "Documents": [".pdf", ".docx", ".txt", ".doc"],
+        "Images": [".jpg", ".png", ".gif", ".jpeg", ".bmp"],
+        "Audio": [".mp3", ".wav", ".flac", ".aac"],
+        "Videos": [".mp4", ".avi", ".mov", ".mkv"],
+        "Archives": [".zip", ".rar", ".7z", ".tar"],
+        "Code": [".py", ".js", ".html", ".css", ".java"],
+        "Executables": [".exe", ".msi", ".bat"]
+    },
+    "default_folder": "Other",
+    "move_unmatched": True,
+    "exclude_patterns": ["*.tmp", "*.bak", "*.log", "desktop.ini"],
+}
+PREFETCH_BATCH = 4096  # scanned files classified per rules prefetch
+
+
+def load_config(path):
+    """Load a config file on top of DEFAULT_CONFIG, ignoring broken JSON."""
+    config = {**DEFAULT_CONFIG, "categories": dict(DEFAULT_CONFIG["categories"])}
+    path = Path(path)
+    if path.exists():
+        try:
+            loaded = json.loads(path.read_text())
+        except json.JSONDecodeError:
+            return config
+        config.update({k: v for k, v in loaded.items() if k != "categories"})
+        config["categories"].update(loaded.get("categories", {}))
+    return config
+
+
+class FileOrganizer:
+    def __init__(self, categories, default_folder="Other", move_unmatched=True,
+                 exclude_patterns=(), recursive=False, workers=1, rules=None):
+        self.categories = dict(categories)
+        self.default_folder = default_folder
+        self.move_unmatched = move_unmatched
+        self.exclude_patterns = [p.strip().lower() for p in exclude_patterns if p.strip()]
+        self.recursive = recursive
+        self.workers = max(1, workers)
+        self.rules = RuleSet(rules) if rules else None
+
+        # First category listing an extension wins, like the old linear scan
+        self._ext_map = {}
+        for category, extensions in self.categories.items():
+            for ext in extensions:
+                self._ext_map.setdefault(ext.lower(), category)
+
+    @classmethod
+    def from_config(cls, config, **overrides):
+        options = {
+            "default_folder": config.get("default_folder", "Other"),
+            "move_unmatched": config.get("move_unmatched", True),
+            "exclude_patterns": config.get("exclude_patterns", []),
+            "rules": config.get("rules"),
+        }
+        options.update(overrides)
+        return cls(config["categories"], **options)
+
+    @property
+    def destinations(self):
+        names = list(self.categories) + [self.default_folder]
+        if self.rules:
+            names += [rule.category for rule in self.rules.rules]
+        return list(dict.fromkeys(names))
+
+    def get_category_for_file(self, filename, path=None, entry=None):
+        # Rules need the file itself; without a path only extensions apply
+        if self.rules and path is not None:
+            category = self.rules.match(path, filename, entry)
+            if category is not None:
+                return category
+        _, file_ext = os.path.splitext(filename.lower())
+        category = self._ext_map.get(file_ext)
+        if category is None and self.move_unmatched:
+            return self.default_folder
+        return category
+
+    def is_excluded(self, filename):
+        name = filename.lower()
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.exclude_patterns)
+
+    def scan(self, directory):
+        """Yield a DirEntry for every candidate file under directory."""
+        skip = set(self.destinations)
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                entries = list(os.scandir(current))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    if not self.is_excluded(entry.name):
+                        yield entry
+                elif self.recursive and entry.is_dir(follow_symlinks=False):
+                    # Never descend into the folders we are sorting into
+                    if current == directory and entry.name in skip:
+                        continue
+                    pending.append(entry.path)
+
+    def collect_files(self, directory):
+        file_map = {cat: [] for cat in self.destinations}
+        total_files = 0
+        entries = self.scan(directory)
+        # Rules prefetch stats in bounded batches so a huge tree is never
+        # held in memory as DirEntry objects all at once
+        while True:
+            batch = list(islice(entries, PREFETCH_BATCH))
+            if not batch:
+                break
+            if self.rules:
+                self.rules.prefetch(batch)
+            for entry in batch:
+                category = self.get_category_for_file(entry.name, entry.path, entry)
+                if category:
+                    file_map.setdefault(category, []).append(entry.path)
+                    total_files += 1
+        return file_map, total_files
+
+    def plan(self, directory):
+        """Work out every move up front so workers never race on names."""
+        file_map, _ = self.collect_files(directory)
+        moves = []
+        for category, files in file_map.items():
+            if not files:
+                continue
+            category_path = os.path.join(directory, category)
+            taken = set(os.listdir(category_path)) if os.path.isdir(category_path) else set()
+            for filepath in files:
+                filename = os.path.basename(filepath)
+                base, ext = os.path.splitext(filename)
+                counter = 1
+                while filename in taken:
+                    filename = f"{base}_{counter}{ext}"
+                    counter += 1
+                taken.add(filename)
+                moves.append({"src": filepath, "dest": os.path.join(category_path, filename),
+                              "category": category})
+        return moves
+
+    def apply_moves(self, moves, on_progress=None):
+        """Perform src -> dest moves, returning (done, errors)."""
+        for folder in {os.path.dirname(move["dest"]) for move in moves}:
+            os.makedirs(folder, exist_ok=True)
+
+        def move_one(move):
+            try:
+                shutil.move(move["src"], move["dest"])
+                return move, None
+            except Exception as e:
+                return move, str(e)
+
+        done, errors = [], []
+        if self.workers > 1 and len(moves) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                results = pool.map(move_one, moves)
+                self._gather(results, len(moves), done, errors, on_progress)
+        else:
+            self._gather(map(move_one, moves), len(moves), done, errors, on_progress)
+        return done, errors
+
+    def _gather(self, results, total, done, errors, on_progress):
+        # Callbacks run on the caller's thread so Tk widgets can be updated
+        for i, (move, error) in enumerate(results, 1):
+            if error is None:
+                done.append(move)
+            else:
+                errors.append({**move, "error": error})
+            if on_progress:
+                on_progress(i, total, move, error)
+
+    def organize(self, directory, dry_run=False, on_progress=None):
+        started = time.perf_counter()
+        moves = self.plan(directory)
+        if dry_run:
+            done, errors = moves, []
+        else:
+            done, errors = self.apply_moves(moves, on_progress)
+        return {
+            "directory": str(directory),
+            "dry_run": dry_run,
+            "moved": len(done),
+            "categories": len({move["category"] for move in done}),
+            "moves": done,
+            "errors": errors,
+            "elapsed": round(time.perf_counter() - started, 6),
+        }
+
+    def undo(self, moves, on_progress=None):
+        """Reverse moves returned by organize() or apply_moves()."""
+        reverse = [{**move, "src": move["dest"], "dest": move["src"]} for move in reversed(moves)]
+        return self.apply_moves(reverse, on_progress)
+
+    def cleanup_empty_dirs(self, directory):
+        removed = []
+        for category in self.destinations:
+            path = os.path.join(directory, category)
+            if os.path.isdir(path) and not os.listdir(path):
+                try:
+                    os.rmdir(path)
+                    removed.append(category)
+                except OSError:
+                    pass
+        return removed
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m file_organizer_engine",
+        description="Sort the files in a directory into category folders.")
+    parser.add_argument("directory", help="directory to organize")
+    parser.add_argument("--config", default=str(Path.home() / ".smart_organizer_config.json"),
+                        help="JSON config with categories and exclude patterns")
+    parser.add_argument("-n", "--dry-run", action="store_true",
+                        help="only report what would be moved")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="also collect files from subdirectories")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="number of parallel move workers")
+    parser.add_argument("--exclude", action="append", default=[], metavar="PATTERN",
+                        help="extra glob pattern to skip (repeatable)")
+    parser.add_argument("--rules", metavar="FILE",
+                        help="JSON list of ordered rules checked before extensions")
+    parser.add_argument("--no-unmatched", action="store_true",
+                        help="leave files without a category in place")
+    parser.add_argument("--undo-log", metavar="FILE",
+                        help="write the performed moves to FILE for --undo")
+    parser.add_argument("--undo", metavar="FILE",
+                        help="reverse the moves recorded in an undo log")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    directory = os.path.abspath(args.directory)
+    if not os.path.isdir(directory):
+        print(f"Error: {directory} is not a directory", file=sys.stderr)
+        return 2
+
+    config = load_config(args.config)
+    overrides = {"recursive": args.recursive, "workers": args.workers}
+    if args.exclude:
+        overrides["exclude_patterns"] = config.get("exclude_patterns", []) + args.exclude
+    if args.rules:
+        overrides["rules"] = json.loads(Path(args.rules).read_text())
+    if args.no_unmatched:
+        overrides["move_unmatched"] = False
+    organizer = FileOrganizer.from_config(config, **overrides)
+
+    if args.undo:
+        moves = json.loads(Path(args.undo).read_text())["moves"]
+        done, errors = organizer.undo(moves)
+        organizer.cleanup_empty_dirs(directory)
+        report = {"directory": directory, "restored": len(done), "errors": errors}
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print(f"Restored {len(done)} of {len(moves)} files")
+        return 1 if errors else 0
+
+    report = organizer.organize(directory, dry_run=args.dry_run)
+    if args.undo_log and not args.dry_run:
+        Path(args.undo_log).write_text(json.dumps({"timestamp": time.time(), "moves": report["moves"]}))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        verb = "Would move" if args.dry_run else "Moved"
+        for move in report["moves"]:
+            print(f"{verb}: {os.path.relpath(move['src'], directory)} -> {move['category']}")
+        for error in report["errors"]:
+            print(f"Error moving {error['src']}: {error['error']}", file=sys.stderr)
+        print(f"{verb} {report['moved']} files into {report['categories']} categories")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
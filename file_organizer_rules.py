@@ -0,0 +1,224 @@
+"""Ordered classification rules for file_organizer_engine.
+
+A rule is a dict in the config's ``"rules"`` list.  Every key given must
+match for the rule to apply and the first matching rule wins:
+
+    {"category": "Big Videos", "extensions": [".mp4", ".mkv"], "min_size": "500MB"}
+    {"category": "Stale", "older_than": 365}
+    {"category": "Scans", "glob": "scan_*", "mime": "application/pdf"}
+    {"category": "Invoices", "regex": "^inv-\\d{4}"}
+    {"category": "Pictures", "mime": "image/*"}
+
+Sizes accept bytes or strings like ``"10MB"``, ages are in days, and
+``mime`` is a glob over the type guessed from the file's first bytes.
+A ``glob`` must match the whole file name, while a ``regex`` may match
+anywhere in it unless anchored with ``^`` or ``$``.
+"""
+
+import os
+import re
+import time
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+
+SNIFF_BYTES = 16
+
+# (offset, signature, mime) checked in order against the first SNIFF_BYTES
+MAGIC_SIGNATURES = [
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (0, b"BM", "image/bmp"),
+    (8, b"WEBP", "image/webp"),
+    (8, b"WAVE", "audio/wav"),
+    (8, b"AVI ", "video/x-msvideo"),
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"fLaC", "audio/flac"),
+    (0, b"OggS", "audio/ogg"),
+    (4, b"ftyp", "video/mp4"),
+    (0, b"\x1a\x45\xdf\xa3", "video/x-matroska"),
+    (0, b"PK\x03\x04", "application/zip"),
+    (0, b"Rar!\x1a\x07", "application/vnd.rar"),
+    (0, b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (0, b"\x1f\x8b", "application/gzip"),
+    (0, b"MZ", "application/x-msdownload"),
+    (0, b"\x7fELF", "application/x-executable"),
+    (0, b"SQLite format 3", "application/vnd.sqlite3"),
+    (0, b"#!", "text/x-script"),
+]
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(value):
+    if value is None or isinstance(value, (int, float)):
+        return value
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*", value.upper())
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+
+
+def sniff_bytes(head):
+    for offset, signature, mime in MAGIC_SIGNATURES:
+        if head.startswith(signature, offset):
+            return mime
+    if not head:
+        return "application/x-empty"
+    try:
+        head.decode("utf-8")
+        return "text/plain"
+    except UnicodeDecodeError:
+        return "application/octet-stream"
+
+
+class MagicSniffer:
+    """Guess MIME types from magic bytes, cached per inode."""
+
+    def __init__(self, workers=8):
+        self.workers = workers
+        self.cache = {}
+
+    @staticmethod
+    def _key(st):
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _read(self, path):
+        try:
+            with open(path, "rb") as f:
+                return sniff_bytes(f.read(SNIFF_BYTES))
+        except OSError:
+            return None
+
+    def sniff(self, path, st):
+        key = self._key(st)
+        if key not in self.cache:
+            self.cache[key] = self._read(path)
+        return self.cache[key]
+
+    def prefetch(self, items):
+        """Read the heads of many (path, stat) pairs in one threaded batch."""
+        pending = {}
+        for path, st in items:
+            key = self._key(st)
+            if key not in self.cache:
+                pending.setdefault(key, path)
+        if not pending:
+            return
+        keys = list(pending)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for key, mime in zip(keys, pool.map(self._read, (pending[k] for k in keys))):
+                self.cache[key] = mime
+
+
+class Rule:
+    __slots__ = ("category", "extensions", "glob", "regex", "min_size", "max_size",
+                 "min_mtime", "max_mtime", "mime", "needs_stat")
+
+    def __init__(self, spec, now):
+        if "category" not in spec:
+            raise ValueError(f"Rule without a category: {spec!r}")
+        self.category = spec["category"]
+        exts = spec.get("extensions")
+        self.extensions = frozenset(e.lower() for e in exts) if exts else None
+
+        # A glob must match the whole name; a regex may match anywhere in it
+        self.glob = re.compile(fnmatch.translate(spec["glob"]), re.IGNORECASE) if spec.get("glob") else None
+        self.regex = None
+        if spec.get("regex"):
+            try:
+                self.regex = re.compile(spec["regex"], re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regex in rule {self.category!r}: {e}") from None
+
+        self.min_size = parse_size(spec.get("min_size"))
+        self.max_size = parse_size(spec.get("max_size"))
+        # Ages become absolute mtime bounds so matching is a plain comparison
+        older, newer = spec.get("older_than"), spec.get("newer_than")
+        self.max_mtime = now - older * 86400 if older is not None else None
+        self.min_mtime = now - newer * 86400 if newer is not None else None
+        self.mime = re.compile(fnmatch.translate(spec["mime"]), re.IGNORECASE) if spec.get("mime") else None
+        self.needs_stat = (self.mime is not None or self.min_size is not None or self.max_size is not None
+                           or self.max_mtime is not None or self.min_mtime is not None)
+
+    def match_name(self, name):
+        if self.glob is not None and not self.glob.match(name):
+            return False
+        return self.regex is None or self.regex.search(name) is not None
+
+    def match(self, name, get_stat, get_mime):
+        # Cheapest checks first; stat and magic bytes are fetched lazily
+        if (self.glob or self.regex) and not self.match_name(name):
+            return False
+        if not self.needs_stat:
+            return True
+        st = get_stat()
+        if st is None:
+            return False
+        if self.min_size is not None and st.st_size < self.min_size:
+            return False
+        if self.max_size is not None and st.st_size > self.max_size:
+            return False
+        if self.max_mtime is not None and st.st_mtime > self.max_mtime:
+            return False
+        if self.min_mtime is not None and st.st_mtime < self.min_mtime:
+            return False
+        if self.mime is not None:
+            mime = get_mime(st)
+            return mime is not None and self.mime.match(mime) is not None
+        return True
+
+
+class RuleSet:
+    """Rules compiled into per-extension candidate lists."""
+
+    def __init__(self, specs, now=None, sniffer=None):
+        now = time.time() if now is None else now
+        self.rules = [Rule(spec, now) for spec in specs]
+        self.sniffer = sniffer or MagicSniffer()
+        self._generic = tuple(r for r in self.rules if r.extensions is None)
+        self._by_ext = {}
+        for ext in {e for r in self.rules if r.extensions for e in r.extensions}:
+            self._by_ext[ext] = tuple(r for r in self.rules
+                                      if r.extensions is None or ext in r.extensions)
+
+    def candidates(self, name):
+        _, ext = os.path.splitext(name.lower())
+        return self._by_ext.get(ext, self._generic)
+
+    def prefetch(self, entries):
+        """Batch the magic-byte reads that match() is going to need."""
+        items = []
+        for entry in entries:
+            if any(r.mime is not None and r.match_name(entry.name) for r in self.candidates(entry.name)):
+                try:
+                    items.append((entry.path, entry.stat()))
+                except OSError:
+                    pass
+        self.sniffer.prefetch(items)
+
+    def match(self, path, name, entry=None):
+        """Return the category of the first matching rule, or None."""
+        rules = self.candidates(name)
+        if not rules:
+            return None
+        cached = []
+
+        def get_stat():
+            if not cached:
+                try:
+                    # DirEntry.stat() is cached and free on Windows
+                    cached.append(entry.stat() if entry is not None else os.stat(path))
+                except OSError:
+                    cached.append(None)
+            return cached[0]
+
+        def get_mime(st):
+            return self.sniffer.sniff(path, st)
+
+        for rule in rules:
+            if rule.match(name, get_stat, get_mime):
+                return rule.category
+        return None
@@ -1,10 +1,44 @@
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep --bench --json output clean
 import pygame
 import random
 import sys
 import math
-import os
+import gc
+import time
+import argparse
+import json
+import numpy as np
+from collections import OrderedDict
 from pygame.locals import *
 from pygame import mixer
+from space_invaders_collision import SpatialHash, groupcollide
+from space_invaders_particles import ParticlePool
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Space Invaders Deluxe")
+    parser.add_argument("--bench", type=int, metavar="FRAMES",
+                        help="play a scripted game headlessly for FRAMES frames and report frame times")
+    parser.add_argument("--seed", type=int,
+                        help="seed every RNG for a reproducible run (0 by default with --bench)")
+    parser.add_argument("--render", choices=("dirty", "flip"), default="dirty",
+                        help="present frames with dirty rects or a full flip")
+    parser.add_argument("--stress", action="store_true",
+                        help="with --bench, keep max weapons, spread shot and shield on")
+    parser.add_argument("--display", action="store_true",
+                        help="with --bench, use the real video and audio devices")
+    parser.add_argument("--json", action="store_true", help="print the benchmark report as JSON")
+    return parser.parse_args(argv)
+
+
+# Only the script reads the command line; importing the module uses the defaults
+ARGS = parse_args() if __name__ == "__main__" else parse_args([])
+HEADLESS = ARGS.bench is not None and not ARGS.display
+if HEADLESS:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+SEED = ARGS.seed if ARGS.seed is not None else (0 if ARGS.bench is not None else None)
+random.seed(SEED)
 
 # Initialize pygame
 pygame.init()
@@ -20,6 +54,9 @@ ENEMY_ROWS = 5
 ENEMY_COLS = 10
 ENEMY_SPACING = 60
 ENEMY_DROP = 30
+PARTICLE_CAPACITY = 10000
+# "dirty" repaints only what moved via display.update(rects); "flip" redraws everything
+RENDER_MODE = ARGS.render
 
 # Colors
 WHITE = (255, 255, 255)
@@ -47,6 +84,12 @@ SHOP = 4
 LEVEL_COMPLETE = 5
 PAUSED = 6
 
+# Simulated milliseconds during --bench runs so every timer is deterministic
+sim_ticks = None
+
+def game_ticks():
+    return pygame.time.get_ticks() if sim_ticks is None else int(sim_ticks)
+
 # Create assets directory if it doesn't exist
 if not os.path.exists('assets'):
     os.makedirs('assets')
@@ -86,72 +129,117 @@ except Exception:
 
 # ----- Particle System -----
 
-class Particle:
-    __slots__ = ('x', 'y', 'color', 'vx', 'vy', 'size', 'life', 'age')
+# Every effect shares one struct-of-arrays pool, drawn in a single blits call
+global_particles = ParticlePool(PARTICLE_CAPACITY, seed=SEED)
 
-    def __init__(self, x, y, color, vx=0.0, vy=0.0, size=3.0, life=20):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx = vx
-        self.vy = vy
-        self.size = size
-        self.life = life
-        self.age = 0
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.1
-        self.age += 1
-        self.size = max(0.0, self.size - 0.05)
-        return self.age < self.life
-
-    def draw(self, surface):
-        if self.size < 0.5:
-            return
-        alpha = int(255 * (1 - self.age / self.life))
-        color = (*self.color, alpha)
-        pygame.draw.circle(surface, color, (int(self.x), int(self.y)), int(self.size))
-
-
-def emit_particles(lst, x, y, color, count, vx_range=(-2, 2), vy_range=(-2, 2),
+def emit_particles(pool, x, y, color, count, vx_range=(-2, 2), vy_range=(-2, 2),
                    size_range=(2, 4), life_range=(20, 40)):
-    """Helper to batch-create particles into a list."""
-    for _ in range(count):
-        lst.append(Particle(
-            x + random.uniform(-10, 10), y + random.uniform(-10, 10),
-            color,
-            vx=random.uniform(*vx_range), vy=random.uniform(*vy_range),
-            size=random.uniform(*size_range),
-            life=random.randint(*life_range)
-        ))
+    """Helper to batch-create particles into a pool."""
+    pool.emit((x - 10, x + 10), (y - 10, y + 10), color, count,
+              vx=vx_range, vy=vy_range, size=size_range, life=life_range)
 
 
 # ----- Starfield -----
 
 class Starfield:
+    # Stars are pre-baked into one screen-sized surface per parallax layer,
+    # which is scrolled and blitted twice to wrap around
+    LAYER_SPEEDS = (0.15, 0.3, 0.45)
+
     def __init__(self, num_stars=150):
-        self.stars = [
-            [random.randint(0, SCREEN_WIDTH),
-             random.randint(0, SCREEN_HEIGHT),
-             random.uniform(0.1, 0.5),
-             random.randint(1, 2),
-             random.randint(100, 255)]
-            for _ in range(num_stars)
-        ]
+        self.layers = []
+        for i, speed in enumerate(self.LAYER_SPEEDS):
+            layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            if i == 0:
+                layer.fill(DARK_BLUE)
+            else:
+                layer.fill(BLACK)
+                layer.set_colorkey(BLACK, RLEACCEL)
+            for _ in range(num_stars // len(self.LAYER_SPEEDS)):
+                b = random.randint(100, 255)
+                pygame.draw.circle(layer, (b, b, b),
+                                   (random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)),
+                                   random.randint(1, 2))
+            self.layers.append(layer.convert())
+        self.offsets = [0.0] * len(self.layers)
+        # Advance only every `quantum` frames so dirty-rect mode can skip
+        # full repaints on the frames in between
+        self.quantum = 1
+        self._frame = 0
 
     def update(self):
-        for star in self.stars:
-            star[1] += star[2]
-            if star[1] > SCREEN_HEIGHT:
-                star[1] = 0
-                star[0] = random.randint(0, SCREEN_WIDTH)
+        self._frame += 1
+        if self._frame % self.quantum:
+            return
+        for i, speed in enumerate(self.LAYER_SPEEDS):
+            self.offsets[i] = (self.offsets[i] + speed * self.quantum) % SCREEN_HEIGHT
+
+    def positions(self):
+        return tuple(int(o) for o in self.offsets)
 
     def draw(self, surface):
-        for x, y, _, size, brightness in self.stars:
-            c = (brightness, brightness, brightness)
-            pygame.draw.circle(surface, c, (int(x), int(y)), size)
+        for layer, y in zip(self.layers, self.positions()):
+            surface.blit(layer, (0, y))
+            if y:
+                surface.blit(layer, (0, y - SCREEN_HEIGHT))
+
+
+# ----- Frame presentation -----
+
+class FrameRenderer:
+    """Flip or dirty-rect presentation, in the spirit of LayeredDirty.
+
+    In dirty mode gameplay frames erase last frame's rects from a cached
+    starfield background and push only erased + newly drawn rects to the
+    display.  Menus and overlays, and frames where the starfield scrolled,
+    fall back to a full repaint.
+    """
+
+    def __init__(self, surface, starfield, mode=RENDER_MODE):
+        self.surface = surface
+        self.starfield = starfield
+        self.mode = mode
+        self.background = pygame.Surface(surface.get_size()).convert()
+        self.tracking = False
+        self.full = True
+        self.dirty = []
+        self.previous = []
+        self._bg_positions = None
+        if mode == "dirty":
+            starfield.quantum = 4
+
+    def begin(self, tracking):
+        self.tracking = self.mode == "dirty" and tracking
+        if not self.tracking:
+            self.starfield.draw(self.surface)
+            return
+        positions = self.starfield.positions()
+        if positions != self._bg_positions:
+            self.starfield.draw(self.background)
+            self._bg_positions = positions
+            self.full = True
+        if self.full:
+            self.surface.blit(self.background, (0, 0))
+        else:
+            for r in self.previous:
+                self.surface.blit(self.background, r, r)
+
+    def mark(self, rects):
+        if self.tracking:
+            if isinstance(rects, pygame.Rect):
+                self.dirty.append(rects.clip(SCREEN_RECT))
+            else:
+                self.dirty.extend(r.clip(SCREEN_RECT) for r in rects)
+
+    def present(self):
+        if not self.tracking or self.full:
+            pygame.display.flip()
+            self.full = not self.tracking
+        else:
+            pygame.display.update(self.previous + self.dirty)
+        self.previous = self.dirty
+        self.dirty = []
 
 
 # ----- Pre-built surfaces cache -----
@@ -164,6 +252,25 @@ def cached_surface(key, builder):
     return _surface_cache[key]
 
 
+# ----- Text surface cache -----
+
+TEXT_CACHE_SIZE = 256
+_text_cache = OrderedDict()
+
+def render_text(fnt, text, color):
+    """font.render() with an LRU cache keyed by font, string and colour."""
+    key = (fnt, text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = fnt.render(text, True, color)
+        _text_cache[key] = surf
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surf
+
+
 # ----- Sprite Classes -----
 
 SCREEN_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -188,7 +295,6 @@ class Player(pygame.sprite.Sprite):
         self.spread_shot = False
         self.spread_shot_time = 0
         self.spread_duration = 10000
-        self.particles = []
         self._engine_acc = 0.0
 
     @staticmethod
@@ -203,35 +309,23 @@ class Player(pygame.sprite.Sprite):
         self.rect.x += self.speed_x
         self.rect.clamp_ip(SCREEN_RECT)
 
-        now = pygame.time.get_ticks()
+        now = game_ticks()
         if self.shield and now - self.shield_time > self.shield_duration:
             self.shield = False
         if self.spread_shot and now - self.spread_shot_time > self.spread_duration:
             self.spread_shot = False
 
-        # Update particles
-        self.particles = [p for p in self.particles if p.update()]
-
         # Engine trail (throttled)
         self._engine_acc += 0.3
         while self._engine_acc >= 1:
             self._engine_acc -= 1
-            self.particles.append(Particle(
-                self.rect.centerx + random.randint(-5, 5),
-                self.rect.bottom,
-                (0, random.randint(150, 255), random.randint(200, 255)),
-                vy=random.uniform(1.0, 3.0),
-                vx=random.uniform(-0.5, 0.5),
-                size=random.uniform(2, 4),
-                life=random.randint(20, 40)
-            ))
-
-    def draw_particles(self, surface):
-        for p in self.particles:
-            p.draw(surface)
+            global_particles.emit(
+                (self.rect.centerx - 5, self.rect.centerx + 5), self.rect.bottom,
+                (0, (150, 255), (200, 255)),
+                vy=(1.0, 3.0), vx=(-0.5, 0.5), size=(2, 4), life=(20, 40))
 
     def shoot(self, all_sprites, bullets):
-        now = pygame.time.get_ticks()
+        now = game_ticks()
         if now - self.last_shot <= self.fire_rate:
             return
         self.last_shot = now
@@ -242,29 +336,31 @@ class Player(pygame.sprite.Sprite):
         bp = self.bullet_power
         new_bullets = []
 
+        spawn = bullet_pool.acquire
         if bp == 1:
-            new_bullets.append(Bullet(cx, top, speed_y=-sp))
+            new_bullets.append(spawn(cx, top, speed_y=-sp))
         elif bp == 2:
-            new_bullets += [Bullet(self.rect.left + 10, top, speed_y=-sp),
-                            Bullet(self.rect.right - 10, top, speed_y=-sp)]
+            new_bullets += [spawn(self.rect.left + 10, top, speed_y=-sp),
+                            spawn(self.rect.right - 10, top, speed_y=-sp)]
         elif bp >= 3:
-            new_bullets += [Bullet(self.rect.left + 10, top, speed_y=-sp),
-                            Bullet(cx, top, speed_y=-sp),
-                            Bullet(self.rect.right - 10, top, speed_y=-sp)]
+            new_bullets += [spawn(self.rect.left + 10, top, speed_y=-sp),
+                            spawn(cx, top, speed_y=-sp),
+                            spawn(self.rect.right - 10, top, speed_y=-sp)]
             if bp >= 4:
-                new_bullets += [Bullet(self.rect.left, self.rect.centery, speed_y=-sp, speed_x=-2),
-                                Bullet(self.rect.right, self.rect.centery, speed_y=-sp, speed_x=2)]
+                new_bullets += [spawn(self.rect.left, self.rect.centery, speed_y=-sp, speed_x=-2),
+                                spawn(self.rect.right, self.rect.centery, speed_y=-sp, speed_x=2)]
 
         if self.spread_shot:
             for angle in (-30, -15, 0, 15, 30):
                 rad = math.radians(angle)
-                new_bullets.append(Bullet(cx, top,
-                                          speed_y=math.cos(rad) * -sp,
-                                          speed_x=math.sin(rad) * 3))
+                new_bullets.append(spawn(cx, top,
+                                         speed_y=math.cos(rad) * -sp,
+                                         speed_x=math.sin(rad) * 3))
 
         for b in new_bullets:
-            all_sprites.add(b)
-            bullets.add(b)
+            if b is not None:
+                all_sprites.add(b)
+                bullets.add(b)
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -276,7 +372,7 @@ class Enemy(pygame.sprite.Sprite):
         3: dict(points=100, drop_chance=0.5, shoot_chance=0.01),  # boss – health set per instance
     }
 
-    def __init__(self, x, y, enemy_type=0, level=1):
+    def __init__(self, x, y, enemy_type=0, level=1, formation=None):
         super().__init__()
         self.enemy_type = enemy_type
         self.level = level
@@ -286,23 +382,37 @@ class Enemy(pygame.sprite.Sprite):
 
         stats = self._TYPE_STATS[enemy_type]
         if enemy_type == 3:
-            self.health = 10 + level * 2
-            self.max_health = self.health
+            health = 10 + level * 2
+            self.max_health = health
             self.points = 100 + level * 20
             self.shoot_chance = 0.01 * (level // 5 + 1)
         else:
-            self.health = stats['health']
+            health = stats['health']
             self.points = stats['points']
             self.shoot_chance = stats['shoot_chance']
         self.drop_chance = stats['drop_chance']
 
-        self.direction = 1
-        self.oscillation = 0.0
-        self.particles = []
         self.osc_speed = random.uniform(0.05, 0.1)
         self.osc_amp = random.randint(5, 15)
         self._boss_particle_acc = 0.0
 
+        # Position, oscillation and health live in the formation's arrays;
+        # this sprite is only the render view of slot `self.slot`
+        self.formation = formation if formation is not None else Formation()
+        self.slot = self.formation.add(self, health)
+
+    @property
+    def health(self):
+        return int(self.formation.health[self.slot])
+
+    @health.setter
+    def health(self, value):
+        self.formation.health[self.slot] = value
+
+    def kill(self):
+        super().kill()
+        self.formation.alive[self.slot] = False
+
     @staticmethod
     def _build_image(enemy_type):
         if enemy_type == 3:
@@ -326,50 +436,34 @@ class Enemy(pygame.sprite.Sprite):
                 pygame.draw.polygon(img, (200, 100, 200), [(20, 10), (10, 30), (30, 30)])
         return img
 
-    def update(self, all_sprites=None, enemy_bullets=None):
-        speed = ENEMY_SPEED * self.direction * (1 + self.level * 0.1)
-        self.rect.x += speed
-        self.oscillation += self.osc_speed
-        self.rect.y += math.sin(self.oscillation) * self.osc_amp * 0.1
-
-        if random.random() < self.shoot_chance and all_sprites is not None:
-            self._do_shoot(all_sprites, enemy_bullets)
-
-        self.particles = [p for p in self.particles if p.update()]
-
+    def update(self):
+        # Movement and shooting are done for the whole formation at once
         if self.enemy_type == 3:
             self._boss_particle_acc += 0.1
             while self._boss_particle_acc >= 1:
                 self._boss_particle_acc -= 1
-                self.particles.append(Particle(
-                    self.rect.centerx + random.randint(-20, 20),
-                    self.rect.bottom,
-                    (random.randint(200, 255), random.randint(100, 150), 0),
-                    vy=random.uniform(1.0, 2.0),
-                    vx=random.uniform(-0.5, 0.5),
-                    size=random.uniform(3, 6),
-                    life=random.randint(30, 50)
-                ))
-
-    def draw_particles(self, surface):
-        for p in self.particles:
-            p.draw(surface)
+                global_particles.emit(
+                    (self.rect.centerx - 20, self.rect.centerx + 20), self.rect.bottom,
+                    ((200, 255), (100, 150), 0),
+                    vy=(1.0, 2.0), vx=(-0.5, 0.5), size=(3, 6), life=(30, 50))
 
     def _do_shoot(self, all_sprites, enemy_bullets):
+        spawn = enemy_bullet_pool.acquire
         if self.enemy_type == 3:
+            shots = []
             for angle in (-30, -15, 0, 15, 30):
                 rad = math.radians(angle)
-                b = EnemyBullet(self.rect.centerx, self.rect.bottom,
-                                math.sin(rad) * BULLET_SPEED / 2,
-                                math.cos(rad) * BULLET_SPEED / 2)
-                all_sprites.add(b); enemy_bullets.add(b)
+                shots.append(spawn(self.rect.centerx, self.rect.bottom,
+                                   math.sin(rad) * BULLET_SPEED / 2,
+                                   math.cos(rad) * BULLET_SPEED / 2))
         elif self.enemy_type == 2:
-            for b in (EnemyBullet(self.rect.left + 10, self.rect.bottom),
-                      EnemyBullet(self.rect.right - 10, self.rect.bottom)):
-                all_sprites.add(b); enemy_bullets.add(b)
+            shots = (spawn(self.rect.left + 10, self.rect.bottom),
+                     spawn(self.rect.right - 10, self.rect.bottom))
         else:
-            b = EnemyBullet(self.rect.centerx, self.rect.bottom)
-            all_sprites.add(b); enemy_bullets.add(b)
+            shots = (spawn(self.rect.centerx, self.rect.bottom),)
+        for b in shots:
+            if b is not None:
+                all_sprites.add(b); enemy_bullets.add(b)
 
     def hit(self, global_particles):
         self.health -= 1
@@ -381,22 +475,148 @@ class Enemy(pygame.sprite.Sprite):
         return self.health <= 0
 
 
-class Bullet(pygame.sprite.Sprite):
+class Formation:
+    """Enemy formation stored as NumPy arrays and stepped in one vectorized pass."""
+
+    def __init__(self, capacity=128, seed=None):
+        self.capacity = capacity
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self):
+        n = self.capacity
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.width = np.zeros(n)
+        self.height = np.zeros(n)
+        self.phase = np.zeros(n)
+        self.osc_speed = np.zeros(n)
+        self.osc_amp = np.zeros(n)
+        self.shoot_chance = np.zeros(n)
+        self.health = np.zeros(n, dtype=np.int32)
+        self.type = np.zeros(n, dtype=np.int8)
+        self.alive = np.zeros(n, dtype=bool)
+        self.sprites = []
+        self.direction = 1
+
+    def _grow(self):
+        for name in ("x", "y", "width", "height", "phase", "osc_speed", "osc_amp",
+                     "shoot_chance", "health", "type", "alive"):
+            arr = getattr(self, name)
+            setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
+        self.capacity *= 2
+
+    def add(self, enemy, health):
+        i = len(self.sprites)
+        if i == self.capacity:
+            self._grow()
+        self.x[i], self.y[i] = enemy.rect.topleft
+        self.width[i], self.height[i] = enemy.rect.size
+        self.phase[i] = 0.0
+        self.osc_speed[i] = enemy.osc_speed
+        self.osc_amp[i] = enemy.osc_amp
+        self.shoot_chance[i] = enemy.shoot_chance
+        self.health[i] = health
+        self.type[i] = enemy.enemy_type
+        self.alive[i] = True
+        self.sprites.append(enemy)
+        return i
+
+    def live(self):
+        return np.flatnonzero(self.alive[:len(self.sprites)])
+
+    def update(self, level, all_sprites, enemy_bullets):
+        live = self.live()
+        if not len(live):
+            return
+        n = len(self.sprites)
+        x, y = self.x[:n], self.y[:n]
+
+        x += ENEMY_SPEED * self.direction * (1 + level * 0.1)
+        self.phase[:n] += self.osc_speed[:n]
+        y += np.sin(self.phase[:n]) * self.osc_amp[:n] * 0.1
+
+        # Wall bounce: the whole formation drops and turns around
+        lx = x[live]
+        if (lx + self.width[live] >= SCREEN_WIDTH).any() or (lx <= 0).any():
+            y += ENEMY_DROP
+            self.direction *= -1
+
+        sprites = self.sprites
+        shooters = live[self.rng.random(len(live)) < self.shoot_chance[live]]
+        for i in shooters.tolist():
+            sprites[i]._do_shoot(all_sprites, enemy_bullets)
+
+        for i, px, py in zip(live.tolist(), x[live].tolist(), y[live].tolist()):
+            sprites[i].rect.topleft = (px, py)
+
+    def reached(self, bottom):
+        live = self.live()
+        return bool((self.y[live] + self.height[live] >= bottom).any())
+
+
+# ----- Object pools -----
+
+class SpritePool:
+    """Fixed-capacity free list so steady-state gameplay allocates no sprites.
+
+    acquire() re-initialises a free sprite through its reset() method; the
+    sprite comes back automatically when it is kill()ed.  An exhausted pool
+    returns None and the spawn is skipped.
+    """
+
+    def __init__(self, factory, capacity):
+        self.free = []
+        for _ in range(capacity):
+            sprite = factory()
+            sprite.pool = self
+            self.free.append(sprite)
+
+    def acquire(self, *args, **kwargs):
+        if not self.free:
+            return None
+        sprite = self.free.pop()
+        sprite.reset(*args, **kwargs)
+        sprite.active = True
+        return sprite
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    pool = None
+    active = False
+
+    def kill(self):
+        super().kill()
+        if self.active:
+            self.active = False
+            self.pool.free.append(self)
+
+
+class Bullet(PooledSprite):
     _img_cache = {}
 
-    def __init__(self, x, y, speed_y=-BULLET_SPEED, speed_x=0, color=WHITE):
+    def __init__(self, x=0, y=0, speed_y=-BULLET_SPEED, speed_x=0, color=WHITE):
         super().__init__()
-        key = color
-        if key not in Bullet._img_cache:
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, speed_y=speed_y, speed_x=speed_x, color=color)
+
+    @staticmethod
+    def _image(color):
+        if color not in Bullet._img_cache:
             img = pygame.Surface((6, 15), pygame.SRCALPHA)
             pygame.draw.rect(img, color, (0, 0, 6, 15))
             pygame.draw.rect(img, YELLOW, (1, 1, 4, 13))
-            Bullet._img_cache[key] = img
-        self.image = Bullet._img_cache[key]
-        self.rect = self.image.get_rect(centerx=x, bottom=y)
+            Bullet._img_cache[color] = img
+        return Bullet._img_cache[color]
+
+    def reset(self, x, y, speed_y=-BULLET_SPEED, speed_x=0, color=WHITE):
+        # Rect is updated in place so reuse allocates nothing
+        self.image = self._image(color)
+        self.rect.size = self.image.get_size()
+        self.rect.centerx = x
+        self.rect.bottom = y
         self.speed_y = speed_y
         self.speed_x = speed_x
-        self.particles = []
         self._trail_acc = 0.0
 
     def update(self):
@@ -407,49 +627,49 @@ class Bullet(pygame.sprite.Sprite):
         self._trail_acc += 0.5
         while self._trail_acc >= 1:
             self._trail_acc -= 1
-            self.particles.append(Particle(
+            global_particles.emit(
                 self.rect.centerx, self.rect.bottom,
-                (random.randint(200, 255), random.randint(200, 255), random.randint(50, 150)),
-                vy=random.uniform(-1.0, 1.0),
-                vx=random.uniform(-0.5, 0.5),
-                size=random.uniform(1, 3),
-                life=random.randint(10, 20)
-            ))
-
-        self.particles = [p for p in self.particles if p.update()]
+                ((200, 255), (200, 255), (50, 150)),
+                vy=(-1.0, 1.0), vx=(-0.5, 0.5), size=(1, 3), life=(10, 20))
 
         if not SCREEN_RECT.colliderect(self.rect):
             self.kill()
 
-    def draw_particles(self, surface):
-        for p in self.particles:
-            p.draw(surface)
-
 
 class EnemyBullet(Bullet):
     _enemy_img = None
 
-    def __init__(self, x, y, speed_x=0, speed_y=BULLET_SPEED / 2):
+    def __init__(self, x=0, y=0, speed_x=0, speed_y=BULLET_SPEED / 2):
         super().__init__(x, y, speed_y, speed_x, color=RED)
+
+    def reset(self, x, y, speed_x=0, speed_y=BULLET_SPEED / 2, color=RED):
+        super().reset(x, y, speed_y, speed_x, color)
         if EnemyBullet._enemy_img is None:
             img = pygame.Surface((8, 20), pygame.SRCALPHA)
             pygame.draw.rect(img, RED, (0, 0, 8, 20))
             pygame.draw.rect(img, ORANGE, (1, 1, 6, 18))
             EnemyBullet._enemy_img = img
         self.image = EnemyBullet._enemy_img
-        self.rect = self.image.get_rect(centerx=x, top=y)
+        self.rect.size = self.image.get_size()
+        self.rect.centerx = x
+        self.rect.top = y
 
 
-class Powerup(pygame.sprite.Sprite):
+class Powerup(PooledSprite):
     _images = {}
 
-    def __init__(self, x, y, powerup_type):
+    def __init__(self, x=0, y=0, powerup_type=0):
         super().__init__()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, powerup_type)
+
+    def reset(self, x, y, powerup_type):
         self.powerup_type = powerup_type
         if powerup_type not in Powerup._images:
             Powerup._images[powerup_type] = self._build_image(powerup_type)
         self.image = Powerup._images[powerup_type]
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect.size = self.image.get_size()
+        self.rect.center = (x, y)
         self._t = 0.0
 
     @staticmethod
@@ -484,51 +704,57 @@ class Powerup(pygame.sprite.Sprite):
             self.kill()
 
 
-class Explosion(pygame.sprite.Sprite):
-    def __init__(self, center, size, color=RED):
+class Explosion(PooledSprite):
+    MAX_FRAME = 10
+
+    def __init__(self, center=(0, 0), size=40, color=RED, burst=False):
         super().__init__()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(center, size, color, burst)
+
+    @staticmethod
+    def _frame_image(size, color, frame):
+        # Every (size, colour, frame) image is built once and shared
+        def build():
+            img = pygame.Surface((size, size), pygame.SRCALPHA)
+            alpha = int(255 * (1 - frame / Explosion.MAX_FRAME))
+            pygame.draw.circle(img, (*color, alpha), (size // 2, size // 2), size // 2)
+            return img
+        return cached_surface(('explosion', size, color, frame), build)
+
+    def reset(self, center, size, color=RED, burst=True):
         self.size = size
         self.color = color
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
-        self.rect = self.image.get_rect(center=center)
         self.frame = 0
-        self.max_frame = 10
-        self.last_update = pygame.time.get_ticks()
+        self.image = self._frame_image(size, color, 0)
+        self.rect.size = (size, size)
+        self.rect.center = center
+        self.last_update = game_ticks()
         self.frame_rate = 50
-        self.particles = []
         # Initial burst
-        for _ in range(30):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(1.0, 5.0)
-            self.particles.append(Particle(
-                center[0], center[1],
-                (random.randint(200, 255), random.randint(50, 150), 0),
-                vx=math.sin(angle) * speed,
-                vy=math.cos(angle) * speed,
-                size=random.uniform(2, 5),
-                life=random.randint(20, 40)
-            ))
+        if burst:
+            global_particles.burst(center[0], center[1], ((200, 255), (50, 150), 0), 30,
+                                   speed=(1.0, 5.0), size=(2, 5), life=(20, 40))
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = game_ticks()
         if now - self.last_update > self.frame_rate:
             self.last_update = now
             self.frame += 1
-            if self.frame >= self.max_frame:
+            if self.frame >= self.MAX_FRAME:
                 self.kill()
                 return
             self.size = max(5, self.size - 2)
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            alpha = int(255 * (1 - self.frame / self.max_frame))
-            pygame.draw.circle(self.image, (*self.color, alpha),
-                               (self.size // 2, self.size // 2), self.size // 2)
-            self.rect = self.image.get_rect(center=self.rect.center)
-        self.particles = [p for p in self.particles if p.update()]
+            self.image = self._frame_image(self.size, self.color, self.frame)
+            center = self.rect.center
+            self.rect.size = (self.size, self.size)
+            self.rect.center = center
 
-    def draw_particles(self, surface):
-        for p in self.particles:
-            p.draw(surface)
+
+bullet_pool = SpritePool(Bullet, 256)
+enemy_bullet_pool = SpritePool(EnemyBullet, 512)
+explosion_pool = SpritePool(Explosion, 64)
+powerup_pool = SpritePool(Powerup, 32)
 
 
 class ShopItem:
@@ -552,9 +778,11 @@ class ShopItem:
 
 all_sprites = pygame.sprite.Group()
 enemies = pygame.sprite.Group()
+formation = Formation(seed=SEED)
 bullets = pygame.sprite.Group()
 enemy_bullets = pygame.sprite.Group()
 powerups = pygame.sprite.Group()
+collision_grid = SpatialHash()
 
 player = Player()
 all_sprites.add(player)
@@ -565,9 +793,9 @@ current_level = 1
 max_level = 10
 shop_items = []
 boss_spawned = False
-global_particles = []
 high_score = 0
 starfield = Starfield(200)
+renderer = FrameRenderer(screen, starfield)
 
 # Fonts
 font = pygame.font.SysFont(None, 36)
@@ -607,11 +835,54 @@ _overlay_blue = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
 _overlay_blue.fill((0, 0, 50, 180))
 
 
+# ----- HUD -----
+
+class Hud:
+    """Pre-rendered HUD panel, rebuilt only when a displayed value changes."""
+
+    def __init__(self):
+        self.surface = pygame.Surface((SCREEN_WIDTH, 82), pygame.SRCALPHA)
+        self.state = None
+
+    def _rebuild(self, player, level):
+        surf = self.surface
+        surf.fill((0, 0, 0, 0))
+        pygame.draw.rect(surf, (20, 20, 50), (0, 0, SCREEN_WIDTH, 80))
+        pygame.draw.line(surf, (100, 100, 200), (0, 80), (SCREEN_WIDTH, 80), 2)
+
+        surf.blit(render_text(font, f"Score: {player.score}", WHITE), (10, 10))
+        surf.blit(render_text(font, f"Level: {level}/{max_level}", WHITE),
+                  (SCREEN_WIDTH // 2 - 50, 10))
+        surf.blit(render_text(font, f"Lives: {player.lives}", WHITE), (SCREEN_WIDTH - 150, 10))
+        for i in range(player.lives):
+            ox = i * 20
+            pygame.draw.polygon(surf, GREEN,
+                                [(SCREEN_WIDTH - 40 - ox, 45),
+                                 (SCREEN_WIDTH - 60 - ox, 65),
+                                 (SCREEN_WIDTH - 20 - ox, 65)])
+        surf.blit(render_text(font, f"Coins: {player.coins}", YELLOW), (SCREEN_WIDTH - 150, 40))
+        pygame.draw.circle(surf, YELLOW, (SCREEN_WIDTH - 185, 55), 8)
+        surf.blit(render_text(small_font, f"Weapon Lvl: {player.bullet_power}", CYAN), (10, 40))
+        surf.blit(render_text(small_font, f"Fire Rate: {1000 // player.fire_rate}/sec", PURPLE), (10, 60))
+
+    def draw(self, surface, player, level):
+        state = (player.score, level, player.lives, player.coins,
+                 player.bullet_power, player.fire_rate)
+        if state != self.state:
+            self.state = state
+            self._rebuild(player, level)
+        return surface.blit(self.surface, (0, 0))
+
+
+hud = Hud()
+
+
 # ----- Game Functions -----
 
 def create_enemies(level):
     global boss_spawned
     boss_spawned = False
+    formation.reset()
     rows = min(ENEMY_ROWS + level // 2, 8)
     cols = min(ENEMY_COLS + level // 3, 15)
     w0 = max(0.0, 0.6 - level * 0.03)
@@ -624,7 +895,7 @@ def create_enemies(level):
         w = weights_boss_row if boss_level and row == 0 else weights_normal
         for col in range(cols):
             enemy_type = random.choices((0, 1, 2), weights=w)[0]
-            e = Enemy(col * ENEMY_SPACING + 50, row * ENEMY_SPACING + 50, enemy_type, level)
+            e = Enemy(col * ENEMY_SPACING + 50, row * ENEMY_SPACING + 50, enemy_type, level, formation)
             all_sprites.add(e)
             enemies.add(e)
 
@@ -636,7 +907,7 @@ def initialize_shop():
                  lambda p: setattr(p, 'lives', p.lives + 1), GREEN),
         ShopItem("Shield", "Temporary invulnerability", 30,
                  lambda p: (setattr(p, 'shield', True),
-                            setattr(p, 'shield_time', pygame.time.get_ticks())), BLUE),
+                            setattr(p, 'shield_time', game_ticks())), BLUE),
         ShopItem("Weapon Upgrade", "Increase bullet power", 40,
                  lambda p: setattr(p, 'bullet_power', min(p.bullet_power + 1, 4)), CYAN),
         ShopItem("Rapid Fire", "Shoot faster", 35,
@@ -647,7 +918,7 @@ def initialize_shop():
                  lambda p: setattr(p, 'shield_duration', p.shield_duration + 5000), ORANGE),
         ShopItem("Spread Shot", "Temporary spread shot", 45,
                  lambda p: (setattr(p, 'spread_shot', True),
-                            setattr(p, 'spread_shot_time', pygame.time.get_ticks())), (255, 100, 255)),
+                            setattr(p, 'spread_shot_time', game_ticks())), (255, 100, 255)),
     ]
 
 
@@ -656,7 +927,9 @@ def reset_game():
     global all_sprites, enemies, bullets, enemy_bullets, powerups
     global boss_spawned, global_particles
 
-    all_sprites.empty()
+    # kill() rather than empty() so pooled sprites return to their pools
+    for sprite in all_sprites.sprites():
+        sprite.kill()
     enemies.empty()
     bullets.empty()
     enemy_bullets.empty()
@@ -753,33 +1026,26 @@ def handle_input():
 def update_game():
     global game_state, boss_spawned, global_particles, current_level
 
-    # Pass shoot groups to enemy.update
+    formation.update(current_level, all_sprites, enemy_bullets)
     for entity in list(all_sprites):
-        if isinstance(entity, Enemy):
-            entity.update(all_sprites, enemy_bullets)
-        else:
-            entity.update()
+        entity.update()
 
     starfield.update()
-    global_particles = [p for p in global_particles if p.update()]
-
-    # Enemy wall-bounce
-    if any(e.rect.right >= SCREEN_WIDTH or e.rect.left <= 0 for e in enemies):
-        for e in enemies:
-            e.rect.y += ENEMY_DROP
-            e.direction *= -1
+    global_particles.update()
 
     # Bullet-enemy collisions
-    hits = pygame.sprite.groupcollide(enemies, bullets, False, True)
+    hits = groupcollide(collision_grid, enemies, bullets, False, True)
     for enemy, _ in hits.items():
         if enemy.hit(global_particles):
             if random.random() < enemy.drop_chance:
-                p = Powerup(enemy.rect.centerx, enemy.rect.centery, random.randint(0, 3))
-                all_sprites.add(p); powerups.add(p)
+                p = powerup_pool.acquire(enemy.rect.centerx, enemy.rect.centery, random.randint(0, 3))
+                if p is not None:
+                    all_sprites.add(p); powerups.add(p)
             player.score += enemy.points
             player.coins += max(1, enemy.points // 5)
-            exp = Explosion(enemy.rect.center, 40, color=(255, min(200, enemy.points), 0))
-            all_sprites.add(exp)
+            exp = explosion_pool.acquire(enemy.rect.center, 40, color=(255, min(200, enemy.points), 0))
+            if exp is not None:
+                all_sprites.add(exp)
             explosion_sound.play()
             enemy.kill()
 
@@ -800,24 +1066,24 @@ def update_game():
         if pu.powerup_type == 0:
             player.lives += 1
         elif pu.powerup_type == 1:
-            player.shield = True; player.shield_time = pygame.time.get_ticks()
+            player.shield = True; player.shield_time = game_ticks()
         elif pu.powerup_type == 2:
             player.coins += 10
         elif pu.powerup_type == 3:
-            player.spread_shot = True; player.spread_shot_time = pygame.time.get_ticks()
+            player.spread_shot = True; player.spread_shot_time = game_ticks()
         emit_particles(global_particles, pu.rect.centerx, pu.rect.centery,
                        POWERUP_COLORS[pu.powerup_type], 15,
                        size_range=(2, 4), life_range=(20, 40))
         powerup_sound.play()
 
     # Enemies reach bottom
-    if any(e.rect.bottom >= SCREEN_HEIGHT - 50 for e in enemies):
+    if formation.reached(SCREEN_HEIGHT - 50):
         game_state = GAME_OVER
 
     # Level complete / boss spawn
     if not enemies:
         if current_level % 5 == 0 and not boss_spawned:
-            boss = Enemy(SCREEN_WIDTH // 2, 50, 3, current_level)
+            boss = Enemy(SCREEN_WIDTH // 2, 50, 3, current_level, formation)
             all_sprites.add(boss); enemies.add(boss)
             boss_spawned = True
         else:
@@ -831,25 +1097,25 @@ def update_game():
 
 def render_game():
     global high_score
-    screen.fill(DARK_BLUE)
-    starfield.draw(screen)
+    # Only live gameplay is tracked rect by rect; menus and overlays repaint fully
+    renderer.begin(game_state == PLAYING)
+    mark = renderer.mark
 
-    for p in global_particles:
-        p.draw(screen)
+    mark(global_particles.draw(screen, renderer.tracking))
 
     if game_state == MENU:
         offset = math.sin(menu_animation) * 5
-        title = title_font.render("SPACE INVADERS DELUXE", True, (100, 255, 255))
+        title = render_text(title_font, "SPACE INVADERS DELUXE", (100, 255, 255))
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 80 + int(offset)))
 
         if high_score > 0:
-            st = font.render(f"High Score: {high_score}", True, YELLOW)
+            st = render_text(font, f"High Score: {high_score}", YELLOW)
             screen.blit(st, (SCREEN_WIDTH // 2 - st.get_width() // 2, 150))
 
         for i, option in enumerate(menu_options):
             color = (100, 255, 100) if i == selected_option else (200, 200, 255)
             off = math.sin(menu_animation + i * 0.5) * 3
-            txt = font.render(option, True, color)
+            txt = render_text(font, option, color)
             bx = SCREEN_WIDTH // 2 - txt.get_width() // 2
             by = 250 + i * 50 + int(off)
             screen.blit(txt, (bx, by))
@@ -858,7 +1124,7 @@ def render_game():
                 pygame.draw.circle(screen, color, (bx - 20, mid_y), 8)
                 pygame.draw.circle(screen, color, (bx + txt.get_width() + 20, mid_y), 8)
 
-        ver = small_font.render("v2.0 Enhanced Edition", True, (150, 150, 255))
+        ver = render_text(small_font, "v2.0 Enhanced Edition", (150, 150, 255))
         screen.blit(ver, (SCREEN_WIDTH - ver.get_width() - 10, SCREEN_HEIGHT - 30))
 
     elif game_state == INSTRUCTIONS:
@@ -866,45 +1132,25 @@ def render_game():
         pygame.draw.rect(screen, (100, 100, 200), (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100), 3, border_radius=10)
         y = 80
         for line in instructions_text:
-            txt = small_font.render(line, True, (200, 220, 255))
+            txt = render_text(small_font, line, (200, 220, 255))
             screen.blit(txt, (SCREEN_WIDTH // 2 - txt.get_width() // 2, y))
             y += 25
-        back = font.render("Press ESC to go back", True, (255, 150, 150))
+        back = render_text(font, "Press ESC to go back", (255, 150, 150))
         screen.blit(back, (SCREEN_WIDTH // 2 - back.get_width() // 2, SCREEN_HEIGHT - 60))
 
     elif game_state in (PLAYING, LEVEL_COMPLETE, GAME_OVER, PAUSED):
-        # Draw sprites + particle trails
-        for entity in all_sprites:
-            if hasattr(entity, 'draw_particles'):
-                entity.draw_particles(screen)
-            screen.blit(entity.image, entity.rect)
-        player.draw_particles(screen)
+        # Draw sprites (their particle trails live in global_particles)
+        mark(screen.blits([(e.image, e.rect) for e in all_sprites], doreturn=renderer.tracking) or ())
 
         # Shield ring
         if player.shield:
-            pygame.draw.circle(screen, (100, 200, 255), player.rect.center, 40, 3)
+            mark(pygame.draw.circle(screen, (100, 200, 255), player.rect.center, 40, 3))
 
         # HUD
-        pygame.draw.rect(screen, (20, 20, 50), (0, 0, SCREEN_WIDTH, 80))
-        pygame.draw.line(screen, (100, 100, 200), (0, 80), (SCREEN_WIDTH, 80), 2)
+        mark(hud.draw(screen, player, current_level))
 
-        screen.blit(font.render(f"Score: {player.score}", True, WHITE), (10, 10))
-        screen.blit(font.render(f"Level: {current_level}/{max_level}", True, WHITE),
-                    (SCREEN_WIDTH // 2 - 50, 10))
-        screen.blit(font.render(f"Lives: {player.lives}", True, WHITE), (SCREEN_WIDTH - 150, 10))
-        for i in range(player.lives):
-            ox = i * 20
-            pygame.draw.polygon(screen, GREEN,
-                                [(SCREEN_WIDTH - 40 - ox, 45),
-                                 (SCREEN_WIDTH - 60 - ox, 65),
-                                 (SCREEN_WIDTH - 20 - ox, 65)])
-        screen.blit(font.render(f"Coins: {player.coins}", True, YELLOW), (SCREEN_WIDTH - 150, 40))
-        pygame.draw.circle(screen, YELLOW, (SCREEN_WIDTH - 185, 55), 8)
-        screen.blit(small_font.render(f"Weapon Lvl: {player.bullet_power}", True, CYAN), (10, 40))
-        screen.blit(small_font.render(f"Fire Rate: {1000 // player.fire_rate}/sec", True, PURPLE), (10, 60))
-
-        shop_hint = small_font.render("S: Shop  P: Pause", True, (150, 255, 150))
-        screen.blit(shop_hint, (SCREEN_WIDTH // 2 - shop_hint.get_width() // 2, SCREEN_HEIGHT - 25))
+        shop_hint = render_text(small_font, "S: Shop  P: Pause", (150, 255, 150))
+        mark(screen.blit(shop_hint, (SCREEN_WIDTH // 2 - shop_hint.get_width() // 2, SCREEN_HEIGHT - 25)))
 
         # Boss health bar
         for enemy in enemies:
@@ -916,57 +1162,57 @@ def render_game():
                 ratio = enemy.health / enemy.max_health
                 hc = (min(255, int(255 * (1 - ratio))), min(255, int(255 * ratio)), 0)
                 pygame.draw.rect(screen, hc, (bx, by, hw, bh))
-                pygame.draw.rect(screen, (200, 200, 200), (bx, by, bw, bh), 2)
-                bl = font.render("BOSS", True, RED)
-                screen.blit(bl, (SCREEN_WIDTH // 2 - bl.get_width() // 2, by - 30))
+                mark(pygame.draw.rect(screen, (200, 200, 200), (bx, by, bw, bh), 2))
+                bl = render_text(font, "BOSS", RED)
+                mark(screen.blit(bl, (SCREEN_WIDTH // 2 - bl.get_width() // 2, by - 30)))
 
         # Overlays
         if game_state == LEVEL_COMPLETE:
             screen.blit(_overlay_dark, (0, 0))
             cy = SCREEN_HEIGHT // 2
             for txt, color, dy in [
-                (font.render(f"LEVEL {current_level} COMPLETE!", True, GREEN), None, -50),
-                (font.render(f"Score: {player.score}  Coins: {player.coins}", True, YELLOW), None, 0),
-                (font.render("Press N for Next Level or S for Shop", True, CYAN), None, 50),
+                (render_text(font, f"LEVEL {current_level} COMPLETE!", GREEN), None, -50),
+                (render_text(font, f"Score: {player.score}  Coins: {player.coins}", YELLOW), None, 0),
+                (render_text(font, "Press N for Next Level or S for Shop", CYAN), None, 50),
             ]:
                 screen.blit(txt, (SCREEN_WIDTH // 2 - txt.get_width() // 2, cy + dy))
 
         elif game_state == GAME_OVER:
             screen.blit(_overlay_dark, (0, 0))
             cy = SCREEN_HEIGHT // 2
-            go = title_font.render("GAME OVER", True, RED)
+            go = render_text(title_font, "GAME OVER", RED)
             screen.blit(go, (SCREEN_WIDTH // 2 - go.get_width() // 2, cy - 100))
             if current_level > max_level:
-                ct = font.render("CONGRATULATIONS! ALL LEVELS COMPLETED!", True, GREEN)
+                ct = render_text(font, "CONGRATULATIONS! ALL LEVELS COMPLETED!", GREEN)
                 screen.blit(ct, (SCREEN_WIDTH // 2 - ct.get_width() // 2, cy - 30))
-            fs = font.render(f"Final Score: {player.score}", True, YELLOW)
+            fs = render_text(font, f"Final Score: {player.score}", YELLOW)
             screen.blit(fs, (SCREEN_WIDTH // 2 - fs.get_width() // 2, cy + 20))
             if player.score > high_score:
                 high_score = player.score
-                nh = font.render("NEW HIGH SCORE!", True, (255, 200, 0))
+                nh = render_text(font, "NEW HIGH SCORE!", (255, 200, 0))
                 screen.blit(nh, (SCREEN_WIDTH // 2 - nh.get_width() // 2, cy + 60))
-            rt = font.render("Press R to Restart", True, (100, 255, 100))
+            rt = render_text(font, "Press R to Restart", (100, 255, 100))
             screen.blit(rt, (SCREEN_WIDTH // 2 - rt.get_width() // 2, cy + 100))
 
         elif game_state == PAUSED:
             screen.blit(_overlay_blue, (0, 0))
             cy = SCREEN_HEIGHT // 2
-            pt = title_font.render("PAUSED", True, CYAN)
+            pt = render_text(title_font, "PAUSED", CYAN)
             screen.blit(pt, (SCREEN_WIDTH // 2 - pt.get_width() // 2, cy - 50))
             for label, color, dy in [
                 ("Press P to Resume", WHITE, 20),
                 ("Press ESC for Main Menu", (200, 200, 255), 70),
             ]:
-                t = font.render(label, True, color)
+                t = render_text(font, label, color)
                 screen.blit(t, (SCREEN_WIDTH // 2 - t.get_width() // 2, cy + dy))
 
     elif game_state == SHOP:
         pygame.draw.rect(screen, (20, 20, 50), (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100), border_radius=15)
         pygame.draw.rect(screen, (100, 100, 200), (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100), 3, border_radius=15)
 
-        title = font.render("SHOP", True, YELLOW)
+        title = render_text(font, "SHOP", YELLOW)
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 70))
-        ct = font.render(f"Your Coins: {player.coins}", True, YELLOW)
+        ct = render_text(font, f"Your Coins: {player.coins}", YELLOW)
         screen.blit(ct, (SCREEN_WIDTH // 2 - ct.get_width() // 2, 110))
 
         for i, item in enumerate(shop_items):
@@ -975,9 +1221,9 @@ def render_game():
             pygame.draw.rect(screen, (150, 150, 220), (100, 160 + i * 70, SCREEN_WIDTH - 200, 60), 2, border_radius=10)
             pygame.draw.circle(screen, item.icon_color, (130, 190 + i * 70), 15)
             nc = (200, 255, 200) if i == selected_shop_item else (200, 200, 255)
-            nt = font.render(f"{item.name} - {item.cost} coins", True, nc)
+            nt = render_text(font, f"{item.name} - {item.cost} coins", nc)
             screen.blit(nt, (160, 170 + i * 70))
-            dt = small_font.render(item.description, True, (180, 220, 255))
+            dt = render_text(small_font, item.description, (180, 220, 255))
             screen.blit(dt, (160, 200 + i * 70))
             if i == selected_shop_item:
                 pygame.draw.polygon(screen, (100, 255, 100),
@@ -985,16 +1231,12 @@ def render_game():
                                      (SCREEN_WIDTH - 140, 180 + i * 70),
                                      (SCREEN_WIDTH - 140, 200 + i * 70)])
 
-        hint = small_font.render("UP/DOWN: select  ENTER: buy  ESC/S: return", True, (200, 200, 255))
+        hint = render_text(small_font, "UP/DOWN: select  ENTER: buy  ESC/S: return", (200, 200, 255))
         screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 60))
 
 
-# ----- Main -----
-
-initialize_shop()
-create_enemies(current_level)
-
-while True:
+def run_frame():
+    global menu_animation
     menu_animation += 0.05
     handle_input()
 
@@ -1002,5 +1244,104 @@ while True:
         update_game()
 
     render_game()
-    pygame.display.flip()
-    clock.tick(60)
+    renderer.present()
+
+
+# ----- Headless benchmark -----
+
+def scripted_keys(frame):
+    """Keys the benchmark presses on a frame: start, strafe, fire and continue."""
+    if game_state == MENU:
+        return [K_RETURN]
+    if game_state == LEVEL_COMPLETE:
+        return [K_n]
+    if game_state == GAME_OVER:
+        return [K_r]
+    if game_state != PLAYING:
+        return []
+    keys = []
+    if frame % 90 == 0:
+        keys.append(K_LEFT if frame // 90 % 2 else K_RIGHT)
+    if frame % 8 == 0:
+        keys.append(K_SPACE)
+    return keys
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_benchmark(frames, stress=False, as_json=False):
+    global sim_ticks
+    sim_ticks = 0
+    times, blocks = [], []
+    counts = {"sprites": [], "enemies": [], "bullets": [], "enemy_bullets": [], "particles": []}
+    collections = gc.get_stats()[0]["collections"]
+
+    for frame in range(frames):
+        for key in scripted_keys(frame):
+            pygame.event.post(pygame.event.Event(KEYDOWN, key=key))
+        if stress:
+            player.bullet_power, player.fire_rate = 4, 200
+            player.spread_shot = player.shield = True
+            player.spread_shot_time = player.shield_time = game_ticks()
+
+        before = sys.getallocatedblocks()
+        started = time.perf_counter()
+        run_frame()
+        times.append((time.perf_counter() - started) * 1000)
+        blocks.append(sys.getallocatedblocks() - before)
+        sim_ticks += 1000 / 60
+
+        for name, group in (("sprites", all_sprites), ("enemies", enemies), ("bullets", bullets),
+                            ("enemy_bullets", enemy_bullets), ("particles", global_particles)):
+            counts[name].append(len(group))
+
+    report = {
+        "frames": frames,
+        "seed": SEED,
+        "render": RENDER_MODE,
+        "frame_ms": {
+            "mean": round(sum(times) / frames, 3),
+            "p50": round(percentile(times, 50), 3),
+            "p95": round(percentile(times, 95), 3),
+            "p99": round(percentile(times, 99), 3),
+            "max": round(max(times), 3),
+        },
+        "entities": {name: {"mean": round(sum(v) / frames, 1), "max": max(v)}
+                     for name, v in counts.items()},
+        "net_blocks_per_frame": round(sum(blocks) / frames, 2),
+        "gc_gen0_collections": gc.get_stats()[0]["collections"] - collections,
+        "final_score": player.score,
+        "level": current_level,
+    }
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return report
+
+    ms = report["frame_ms"]
+    print(f"{frames} frames, seed {SEED}, {RENDER_MODE} rendering")
+    print(f"frame ms  mean {ms['mean']}  p50 {ms['p50']}  p95 {ms['p95']}  p99 {ms['p99']}  max {ms['max']}")
+    for name, stat in report["entities"].items():
+        print(f"{name:>14}: mean {stat['mean']:>8}  max {stat['max']}")
+    print(f"net allocated blocks/frame: {report['net_blocks_per_frame']}  "
+          f"gen0 collections: {report['gc_gen0_collections']}")
+    print(f"score {player.score} on level {current_level}")
+    return report
+
+
+# ----- Main -----
+
+if __name__ == "__main__":
+    initialize_shop()
+    create_enemies(current_level)
+
+    if ARGS.bench is not None:
+        run_benchmark(ARGS.bench, ARGS.stress, ARGS.json)
+        pygame.quit()
+        sys.exit()
+
+    while True:
+        run_frame()
+        clock.tick(60)
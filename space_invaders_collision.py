@@ -0,0 +1,122 @@
+"""Uniform-grid broadphase for the space invaders collision checks.
+
+Run ``python space_invaders_collision.py`` for a bench scene that compares
+frame time against pygame.sprite.groupcollide as the entity count grows.
+"""
+
+import sys
+import time
+import random
+import pygame
+
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.order = {}
+
+    def _span(self, rect):
+        cs = self.cell_size
+        return rect.left // cs, rect.top // cs, (rect.right - 1) // cs, (rect.bottom - 1) // cs
+
+    def rebuild(self, sprites):
+        """Re-bucket every sprite by the cells its rect overlaps."""
+        cells = self.cells
+        cells.clear()
+        self.order.clear()
+        for i, sprite in enumerate(sprites):
+            self.order[sprite] = i
+            x0, y0, x1, y1 = self._span(sprite.rect)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [sprite]
+                    else:
+                        bucket.append(sprite)
+
+    def query(self, rect):
+        x0, y0, x1, y1 = self._span(rect)
+        if x0 == x1 and y0 == y1:
+            return self.cells.get((x0, y0), ())
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for sprite in self.cells.get((cx, cy), ()):
+                    found[sprite] = None
+        return found
+
+    def collide(self, rect):
+        """Narrow phase: sprites in the grid whose rect overlaps rect."""
+        return [s for s in self.query(rect) if rect.colliderect(s.rect)]
+
+
+def groupcollide(grid, groupa, groupb, dokilla, dokillb):
+    """Drop-in for pygame.sprite.groupcollide with a grid built over groupa."""
+    grid.rebuild(groupa)
+    crashed = {}
+    for b in groupb.sprites():
+        hits = grid.collide(b.rect)
+        if not hits:
+            continue
+        if dokillb:
+            # pygame kills b on the first sprite of groupa it meets
+            hits = [min(hits, key=grid.order.__getitem__)]
+            b.kill()
+        for a in hits:
+            crashed.setdefault(a, []).append(b)
+    if dokilla:
+        for a in crashed:
+            a.kill()
+    return crashed
+
+
+# ----- Bench scene -----
+
+def _make_scene(enemy_count, bullet_count, rng):
+    enemies, bullets = pygame.sprite.Group(), pygame.sprite.Group()
+    for _ in range(enemy_count):
+        s = pygame.sprite.Sprite()
+        s.rect = pygame.Rect(rng.randrange(0, 760), rng.randrange(50, 500), 40, 40)
+        enemies.add(s)
+    for _ in range(bullet_count):
+        s = pygame.sprite.Sprite()
+        s.rect = pygame.Rect(rng.randrange(0, 794), rng.randrange(0, 585), 6, 15)
+        s.speed_y = rng.choice((-7, 3.5))
+        bullets.add(s)
+    return enemies, bullets
+
+
+def _step(bullets):
+    for b in bullets:
+        b.rect.y = (b.rect.y + b.speed_y) % 600
+
+
+def bench(counts, frames=300, seed=0):
+    grid = SpatialHash()
+    naive = lambda e, b: pygame.sprite.groupcollide(e, b, False, False)
+    hashed = lambda e, b: groupcollide(grid, e, b, False, False)
+    rows = []
+    for enemy_count in counts:
+        bullet_count = max(10, enemy_count // 2)
+        row = {"enemies": enemy_count, "bullets": bullet_count}
+        for name, func in (("groupcollide", naive), ("grid", hashed)):
+            enemies, bullets = _make_scene(enemy_count, bullet_count, random.Random(seed))
+            started = time.perf_counter()
+            for _ in range(frames):
+                _step(bullets)
+                func(enemies, bullets)
+            row[name] = (time.perf_counter() - started) * 1000 / frames
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    counts = [int(a) for a in sys.argv[1:]] or [50, 120, 250, 500, 1000, 2000]
+    print(f"{'enemies':>8} {'bullets':>8} {'groupcollide ms':>16} {'grid ms':>9} {'speedup':>8}")
+    for row in bench(counts):
+        print(f"{row['enemies']:>8} {row['bullets']:>8} {row['groupcollide']:>16.3f} "
+              f"{row['grid']:>9.3f} {row['groupcollide'] / row['grid']:>7.1f}x")
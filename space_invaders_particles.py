@@ -0,0 +1,182 @@
+"""Struct-of-arrays particle pool for space invaders.
+
+Every particle lives in a slot of a set of NumPy arrays, so integration and
+culling are a handful of vector ops per frame no matter how many explosions
+are running.  Drawing goes through one Surface.blits() call using small
+pre-rendered alpha circles keyed by colour, radius and fade step.
+"""
+
+import math
+import random
+import numpy as np
+import pygame
+
+GRAVITY = 0.1
+SHRINK = 0.05
+MAX_RADIUS = 8
+ALPHA_STEPS = 8
+DIRTY_TILE = 32
+
+
+def _quantize(color):
+    # 4 bits per channel keeps the sprite cache small; 255 maps back to 255
+    r, g, b = (np.asarray(c, dtype=np.int32) // 16 for c in color)
+    return (r << 8) | (g << 4) | b
+
+
+class ParticlePool:
+    FIELDS = ("x", "y", "vx", "vy", "size", "life", "age")
+
+    def __init__(self, capacity=10000, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self.rng = np.random.default_rng(seed)
+        self.py_rng = random.Random(seed)
+        self._sprites = {}
+
+    def __len__(self):
+        return self.count
+
+    def seed(self, seed):
+        self.rng = np.random.default_rng(seed)
+        self.py_rng = random.Random(seed)
+
+    def clear(self):
+        self.count = 0
+
+    def _sample(self, value, n):
+        """Scalars are used as-is, (lo, hi) pairs are drawn uniformly."""
+        if isinstance(value, tuple):
+            return self.rng.uniform(value[0], value[1], n)
+        return np.full(n, value, dtype=np.float32)
+
+    def _reserve(self, count):
+        # A full pool drops the newest particles rather than reallocating
+        start = self.count
+        stop = min(self.capacity, start + count)
+        self.count = stop
+        return start, stop
+
+    def emit(self, x, y, color, count=1, vx=0.0, vy=0.0, size=3.0, life=20):
+        """Spawn count particles; any argument may be a (lo, hi) range.
+
+        color is an (r, g, b) whose channels may also be (lo, hi) ranges.
+        """
+        if count == 1:
+            self._emit_one(x, y, color, vx, vy, size, life)
+            return
+        start, stop = self._reserve(count)
+        n = stop - start
+        if n <= 0:
+            return
+        s = slice(start, stop)
+        self.x[s] = self._sample(x, n)
+        self.y[s] = self._sample(y, n)
+        self.vx[s] = self._sample(vx, n)
+        self.vy[s] = self._sample(vy, n)
+        self.size[s] = self._sample(size, n)
+        if isinstance(life, tuple):
+            self.life[s] = self.rng.integers(life[0], life[1] + 1, n)
+        else:
+            self.life[s] = life
+        self.age[s] = 0
+        channels = [self.rng.integers(c[0], c[1] + 1, n) if isinstance(c, tuple) else c for c in color]
+        self.color[s] = _quantize(channels)
+
+    def _emit_one(self, x, y, color, vx, vy, size, life):
+        # Trails spawn one particle at a time; NumPy call overhead would
+        # dominate, so draw scalars in Python and write a single slot
+        if self.count >= self.capacity:
+            return
+        rng = self.py_rng
+        pick = lambda v: rng.uniform(*v) if isinstance(v, tuple) else v
+        i = self.count
+        self.count += 1
+        self.x[i] = pick(x)
+        self.y[i] = pick(y)
+        self.vx[i] = pick(vx)
+        self.vy[i] = pick(vy)
+        self.size[i] = pick(size)
+        self.life[i] = rng.randint(*life) if isinstance(life, tuple) else life
+        self.age[i] = 0
+        r, g, b = (rng.randint(*c) if isinstance(c, tuple) else c for c in color)
+        self.color[i] = ((r // 16) << 8) | ((g // 16) << 4) | (b // 16)
+
+    def burst(self, x, y, color, count, speed=(1.0, 5.0), size=(2, 5), life=(20, 40)):
+        """Radial explosion: random angles with speeds drawn from speed."""
+        start = self.count
+        self.emit(x, y, color, count, size=size, life=life)
+        s = slice(start, self.count)
+        n = self.count - start
+        angle = self.rng.uniform(0, math.tau, n)
+        spd = self._sample(speed, n)
+        self.vx[s] = np.sin(angle) * spd
+        self.vy[s] = np.cos(angle) * spd
+
+    def update(self):
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += GRAVITY
+        self.age[:n] += 1
+        size = self.size[:n]
+        np.maximum(size - SHRINK, 0.0, out=size)
+
+        alive = self.age[:n] < self.life[:n]
+        if alive.all():
+            return
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        for arr in (self.x, self.y, self.vx, self.vy, self.size, self.life, self.age, self.color):
+            arr[:k] = arr[keep]
+        self.count = k
+
+    def _sprite(self, key):
+        color, rest = divmod(key, MAX_RADIUS * ALPHA_STEPS)
+        radius, step = divmod(rest, ALPHA_STEPS)
+        rgb = ((color >> 8) * 17, ((color >> 4) & 15) * 17, (color & 15) * 17)
+        alpha = 255 * (step + 1) // ALPHA_STEPS
+        img = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(img, (*rgb, alpha), (radius, radius), radius)
+        self._sprites[key] = img
+        return img
+
+    def draw(self, surface, dirty=False):
+        """Blit every visible particle.
+
+        With dirty set, returns the DIRTY_TILE-sized tiles they touched, so
+        thousands of particles cost a few hundred update rects at most.
+        """
+        n = self.count
+        if not n:
+            return []
+        radius = np.minimum(self.size[:n].astype(np.int32), MAX_RADIUS - 1)
+        visible = np.flatnonzero(radius >= 1)
+        if not len(visible):
+            return []
+        radius = radius[visible]
+        fade = 1.0 - self.age[:n][visible] / self.life[:n][visible]
+        step = np.clip((fade * ALPHA_STEPS).astype(np.int32), 0, ALPHA_STEPS - 1)
+        keys = (self.color[:n][visible] * MAX_RADIUS + radius) * ALPHA_STEPS + step
+        left = (self.x[:n][visible].astype(np.int32) - radius).tolist()
+        top = (self.y[:n][visible].astype(np.int32) - radius).tolist()
+
+        sprites = self._sprites
+        surface.blits([(sprites.get(k) or self._sprite(k), (px, py))
+                       for k, px, py in zip(keys.tolist(), left, top)], doreturn=False)
+        if not dirty:
+            return []
+        left, top = np.array(left), np.array(top)
+        # Off-screen particles clamp to the edge tiles, which is harmless
+        x0, y0 = (np.clip(v // DIRTY_TILE, 0, 0x7FFF) for v in (left, top))
+        x1, y1 = (np.clip((v + radius * 2 - 1) // DIRTY_TILE, 0, 0x7FFF) for v in (left, top))
+        # A particle is at most 2x2 tiles, so its corners cover every tile it touches
+        tiles = np.unique(np.concatenate([
+            (x0 << 16) + y0, (x1 << 16) + y0, (x0 << 16) + y1, (x1 << 16) + y1]))
+        return [pygame.Rect((t >> 16) * DIRTY_TILE, (t & 0xFFFF) * DIRTY_TILE, DIRTY_TILE, DIRTY_TILE)
+                for t in tiles.tolist()]
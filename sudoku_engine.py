@@ -0,0 +1,458 @@
+"""Bitboard Sudoku solver used by Sudoku game.py.
+
+Cells are indexed 0..80 row by row.  A board is a list of 81 digits (0 for
+empty) plus a list of 81 candidate bitmasks, where bit d-1 set means d is
+still possible.  Placing a digit clears its bit from the cell's 20 peers,
+naked and hidden singles are propagated to a fixed point, and the search
+branches on the empty cell with the fewest candidates.
+
+Run as a script (or via Sudoku game.py with arguments) to batch-solve
+puzzles or time the bundled corpus:
+
+    python sudoku_engine.py puzzles.txt -j 4 -o solutions.txt
+    python sudoku_engine.py --bench -j 4
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import multiprocessing
+from collections import deque
+
+ALL_DIGITS = 0x1FF
+BIT = [0] + [1 << (d - 1) for d in range(1, 10)]
+DIGIT_OF = {1 << (d - 1): d for d in range(1, 10)}
+POPCOUNT = [bin(m).count("1") for m in range(ALL_DIGITS + 1)]
+
+ROW_OF = [i // 9 for i in range(81)]
+COL_OF = [i % 9 for i in range(81)]
+BOX_OF = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+
+ROWS = [tuple(r * 9 + c for c in range(9)) for r in range(9)]
+COLS = [tuple(r * 9 + c for r in range(9)) for c in range(9)]
+BOXES = [tuple(i for i in range(81) if BOX_OF[i] == b) for b in range(9)]
+UNITS = ROWS + COLS + BOXES
+UNITS_OF = [(ROW_OF[i], 9 + COL_OF[i], 18 + BOX_OF[i]) for i in range(81)]
+PEERS = [tuple(sorted(set(ROWS[ROW_OF[i]] + COLS[COL_OF[i]] + BOXES[BOX_OF[i]]) - {i}))
+         for i in range(81)]
+
+
+def digits(mask):
+    """The digits set in a candidate mask, in ascending order."""
+    return [d for d in range(1, 10) if mask & BIT[d]]
+
+
+def parse(text):
+    """Read an 81-character puzzle; '0' and '.' mark empty cells."""
+    text = "".join(ch for ch in text if not ch.isspace())
+    if len(text) != 81:
+        raise ValueError(f"Expected 81 cells, got {len(text)}")
+    return [0 if ch in "0." else int(ch) for ch in text]
+
+
+def format_values(values, empty="."):
+    return "".join(str(v) if v else empty for v in values)
+
+
+def from_grid(grid):
+    return [grid[r][c] for r in range(9) for c in range(9)]
+
+
+def to_grid(values):
+    return [list(values[r * 9:r * 9 + 9]) for r in range(9)]
+
+
+def _assign(values, cand, i, d):
+    """Place d at i and strike it from the peers; False on a contradiction."""
+    bit = BIT[d]
+    values[i] = d
+    cand[i] = 0
+    for p in PEERS[i]:
+        c = cand[p]
+        if c & bit:
+            c &= ~bit
+            cand[p] = c
+            if not c:
+                return False
+        elif values[p] == d:
+            return False
+    return True
+
+
+def load(values):
+    """Build (values, cand) from 81 digits, or None if the givens clash."""
+    board = [0] * 81
+    cand = [ALL_DIGITS] * 81
+    for i, d in enumerate(values):
+        if d and not (cand[i] & BIT[d] and _assign(board, cand, i, d)):
+            return None
+    return board, cand
+
+
+def propagate(values, cand, stats=None):
+    """Apply naked and hidden singles until nothing changes.
+
+    stats, if given, counts the placements made by each technique.
+    """
+    progress = True
+    while progress:
+        progress = False
+        for i in range(81):
+            c = cand[i]
+            if c and not c & (c - 1):
+                if not _assign(values, cand, i, DIGIT_OF[c]):
+                    return False
+                if stats is not None:
+                    stats["naked"] += 1
+                progress = True
+        if progress:
+            continue
+        for unit in UNITS:
+            once = twice = placed = 0
+            for i in unit:
+                c = cand[i]
+                twice |= once & c
+                once |= c
+                placed |= BIT[values[i]]
+            if (once | placed) != ALL_DIGITS:
+                return False
+            hidden = once & ~twice
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                for i in unit:
+                    if cand[i] & bit:
+                        if not _assign(values, cand, i, DIGIT_OF[bit]):
+                            return False
+                        if stats is not None:
+                            stats["hidden"] += 1
+                        progress = True
+                        break
+    return True
+
+
+def _most_constrained(values, cand):
+    best, best_count = -1, 10
+    for i in range(81):
+        if not values[i]:
+            n = POPCOUNT[cand[i]]
+            if n < best_count:
+                best, best_count = i, n
+                if n == 2:
+                    break
+    return best
+
+
+def _search(values, cand, rng, limit, found, stats):
+    if not propagate(values, cand, stats):
+        return
+    i = _most_constrained(values, cand)
+    if i < 0:
+        found.append(values)
+        return
+    options = digits(cand[i])
+    if rng is not None:
+        rng.shuffle(options)
+    for d in options:
+        if stats is not None:
+            stats["guesses"] += 1
+        v, c = values[:], cand[:]
+        if _assign(v, c, i, d):
+            _search(v, c, rng, limit, found, stats)
+            if len(found) >= limit:
+                return
+
+
+def solve(values, rng=None, stats=None):
+    """Return a solved copy of 81 digits, or None if there is no solution.
+
+    With rng (a random.Random) the branching order is shuffled, which turns
+    solving an empty board into generating a random full grid.
+    """
+    loaded = load(values)
+    if loaded is None:
+        return None
+    found = []
+    _search(*loaded, rng, 1, found, stats)
+    return found[0] if found else None
+
+
+def count_solutions(values, limit=2):
+    """Count solutions, stopping as soon as limit are found."""
+    loaded = load(values)
+    if loaded is None:
+        return 0
+    found = []
+    _search(*loaded, None, limit, found, None)
+    return len(found)
+
+
+def random_solution(rng=None):
+    return solve([0] * 81, rng or random.Random())
+
+
+class ConflictTracker:
+    """Digit counts per row, column and box, updated one cell at a time.
+
+    Keeps a filled-cell total and the number of (unit, digit) pairs that
+    appear more than once, so conflict and completion checks never rescan
+    the grid.
+    """
+
+    def __init__(self, grid=None):
+        self.reset(grid)
+
+    def reset(self, grid=None):
+        self.values = [0] * 81
+        self.counts = [[0] * 10 for _ in range(27)]
+        self.filled = 0
+        self.clashes = 0
+        if grid is not None:
+            for row in range(9):
+                for col in range(9):
+                    self.set(row, col, grid[row][col])
+
+    def set(self, row, col, digit):
+        i = row * 9 + col
+        old = self.values[i]
+        if old == digit:
+            return
+        if old:
+            self.filled -= 1
+            for u in UNITS_OF[i]:
+                self.counts[u][old] -= 1
+                if self.counts[u][old] == 1:
+                    self.clashes -= 1
+        if digit:
+            self.filled += 1
+            for u in UNITS_OF[i]:
+                self.counts[u][digit] += 1
+                if self.counts[u][digit] == 2:
+                    self.clashes += 1
+        self.values[i] = digit
+
+    def is_conflict(self, row, col):
+        i = row * 9 + col
+        digit = self.values[i]
+        return bool(digit) and any(self.counts[u][digit] > 1 for u in UNITS_OF[i])
+
+    def is_solved(self):
+        return self.filled == 81 and not self.clashes
+
+
+# ----- Generation -----
+
+LEVELS = ("easy", "medium", "hard")
+
+
+def grade(values):
+    """Rate a puzzle by the hardest technique its solution needs.
+
+    easy: naked singles only; medium: hidden singles as well;
+    hard: at least one guess.  Returns None for an unsolvable puzzle.
+    """
+    stats = {"naked": 0, "hidden": 0, "guesses": 0}
+    if solve(values, stats=stats) is None:
+        return None
+    if stats["guesses"]:
+        return "hard"
+    return "medium" if stats["hidden"] else "easy"
+
+
+def _unique_within(values, level):
+    # Anything solved by singles alone is unique, so only "hard" needs counting
+    rating = grade(values)
+    if rating is None or LEVELS.index(rating) > LEVELS.index(level):
+        return False
+    return rating != "hard" or count_solutions(values, 2) == 1
+
+
+def _dig(givens, level, rng):
+    solution = random_solution(rng)
+    puzzle = solution[:]
+    cells = list(range(81))
+    rng.shuffle(cells)
+    remaining = 81
+    for i in cells:
+        if remaining <= givens:
+            break
+        puzzle[i] = 0
+        if _unique_within(puzzle, level):
+            remaining -= 1
+        else:
+            puzzle[i] = solution[i]
+    return puzzle, solution
+
+
+def generate(givens, level="hard", rng=None, attempts=50):
+    """Make a puzzle with a unique solution that grades as level.
+
+    Clues are removed down to givens while the puzzle stays unique and no
+    harder than level, so a few more givens than asked for may remain.
+    A puzzle that comes out easier than level is thrown away and a new one
+    dug, up to attempts times; if none reaches level the hardest is kept.
+    Returns (puzzle, solution, grade) with the grids as flat lists of 81 digits.
+    """
+    rng = rng or random.Random()
+    best = None
+    for _ in range(attempts):
+        puzzle, solution = _dig(givens, level, rng)
+        rating = grade(puzzle)
+        if best is None or LEVELS.index(rating) > LEVELS.index(best[2]):
+            best = (puzzle, solution, rating)
+        if rating == level:
+            break
+    return best
+
+
+class PuzzlePool:
+    """A few ready puzzles per difficulty, refilled by a daemon thread.
+
+    difficulties maps a key to the (givens, level) passed to generate().
+    """
+
+    def __init__(self, difficulties, size=3, seed=None):
+        self.difficulties = dict(difficulties)
+        self.size = size
+        self.rng = random.Random(seed)
+        self.ready = {key: deque() for key in self.difficulties}
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = threading.Thread(target=self._fill, daemon=True)
+        self.thread.start()
+
+    def _fill(self):
+        while True:
+            self.wake.clear()
+            for key, (givens, level) in self.difficulties.items():
+                while len(self.ready[key]) < self.size:
+                    puzzle = generate(givens, level, self.rng)
+                    with self.lock:
+                        self.ready[key].append(puzzle)
+            self.wake.wait()
+
+    def get(self, key):
+        """Take a ready puzzle, generating one in place if the pool is dry."""
+        with self.lock:
+            puzzle = self.ready[key].popleft() if self.ready[key] else None
+        self.wake.set()
+        if puzzle is None:
+            givens, level = self.difficulties[key]
+            puzzle = generate(givens, level)
+        return puzzle
+
+
+# ----- Batch solving -----
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sudoku_corpus")
+CORPUS_SETS = ("easy", "medium", "hard", "hardest")
+
+
+def read_puzzles(stream):
+    """Yield puzzle lines, skipping blanks and # comments."""
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def solve_line(line):
+    """Solve one 81-character puzzle; returns (puzzle, solution or None, seconds)."""
+    started = time.perf_counter()
+    try:
+        solution = solve(parse(line))
+    except ValueError:
+        solution = None
+    return line, solution and format_values(solution), time.perf_counter() - started
+
+
+def solve_many(puzzles, workers=1, chunksize=32, pool=None):
+    """Solve an iterable of puzzle lines in order, across a process pool if workers > 1."""
+    if pool is not None:
+        yield from pool.imap(solve_line, puzzles, chunksize)
+    elif workers <= 1:
+        yield from map(solve_line, puzzles)
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            yield from pool.imap(solve_line, puzzles, chunksize)
+
+
+def bench(sets, workers=1, chunksize=32):
+    # One pool for every set so worker start-up is not billed to the first
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        return [_bench_set(name, pool, chunksize) for name in sets]
+    finally:
+        if pool is not None:
+            pool.close()
+
+
+def _bench_set(name, pool, chunksize):
+    with open(os.path.join(CORPUS_DIR, name + ".txt")) as f:
+        puzzles = list(read_puzzles(f))
+    started = time.perf_counter()
+    results = list(solve_many(puzzles, chunksize=chunksize, pool=pool))
+    elapsed = time.perf_counter() - started
+    return {
+        "set": name,
+        "puzzles": len(puzzles),
+        "solved": sum(1 for _, solution, _ in results if solution),
+        "seconds": round(elapsed, 4),
+        "puzzles_per_sec": round(len(puzzles) / elapsed, 1),
+        "max_ms": round(max(seconds for _, _, seconds in results) * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Solve Sudoku puzzles given one per line as 81 characters ('.' or '0' for blanks).")
+    parser.add_argument("files", nargs="*", help="puzzle files, - for stdin (default: stdin)")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="solver processes")
+    parser.add_argument("--chunksize", type=int, default=32, help="puzzles sent to a worker at a time")
+    parser.add_argument("-o", "--output", help="write solutions here instead of stdout")
+    parser.add_argument("--bench", nargs="*", choices=CORPUS_SETS, metavar="SET",
+                        help="time the bundled corpus instead (sets: %(choices)s; default all)")
+    parser.add_argument("--json", action="store_true", help="print --bench results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.bench is not None:
+        rows = bench(args.bench or CORPUS_SETS, args.workers, args.chunksize)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+            return 0
+        print(f"{'set':<8} {'puzzles':>7} {'solved':>6} {'seconds':>8} {'puzzles/s':>10} {'max ms':>8}")
+        for row in rows:
+            print(f"{row['set']:<8} {row['puzzles']:>7} {row['solved']:>6} {row['seconds']:>8.3f} "
+                  f"{row['puzzles_per_sec']:>10} {row['max_ms']:>8}")
+        return 0
+
+    streams = [sys.stdin if path == "-" else open(path) for path in args.files] or [sys.stdin]
+    out = open(args.output, "w") if args.output else sys.stdout
+    puzzles = (line for stream in streams for line in read_puzzles(stream))
+    count = failed = 0
+    started = time.perf_counter()
+    try:
+        # Each line: solution (or "unsolvable") and the solve time in ms
+        for _, solution, seconds in solve_many(puzzles, args.workers, args.chunksize):
+            count += 1
+            if solution is None:
+                failed += 1
+            out.write(f"{solution or 'unsolvable'}\t{seconds * 1000:.3f}\n")
+    finally:
+        for stream in streams:
+            if stream is not sys.stdin:
+                stream.close()
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - started
+    print(f"{count} puzzles, {failed} unsolvable, {elapsed:.3f}s "
+          f"({count / elapsed if elapsed else 0:.1f} puzzles/s)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,95 @@ import time
 from PIL import Image, ImageTk
 import winsound
 import sys
+import threading
+import tic_tac_toe_engine as engine
+from tic_tac_toe_history import GameHistory
+
+# (board size, win length, menu label)
+BOARD_PRESETS = [
+    (3, 3, "3x3 Classic"),
+    (4, 4, "4x4, 4 in a row"),
+    (5, 4, "5x5, 4 in a row"),
+    (7, 5, "7x7, 5 in a row"),
+    (15, 5, "15x15 Gomoku"),
+]
+
+RAMP_STEPS = 32
+
+
+class Tween:
+    """Calls step(t) with t going from 0 to 1 over duration ms, then done()"""
+    def __init__(self, duration, step, done=None, repeat=False):
+        self.duration = max(1, duration)
+        self.step = step
+        self.done = done
+        self.repeat = repeat
+        self.start = None
+
+
+class Animator:
+    """One fixed-tick root.after loop that advances every running tween.
+
+    Tweens are keyed so restarting an effect replaces the old one, and the
+    loop stops scheduling itself once nothing is left to animate.
+    """
+    TICK = 33  # ms
+
+    def __init__(self, root):
+        self.root = root
+        self.tweens = {}
+        self.ramps = {}
+        self.after_id = None
+
+    def ramp(self, color1, color2):
+        """RAMP_STEPS hex colours from color2 (alpha 0) to color1 (alpha 1)"""
+        key = (color1, color2)
+        if key not in self.ramps:
+            r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
+            r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
+            ramp = []
+            for i in range(RAMP_STEPS):
+                a = i / (RAMP_STEPS - 1)
+                ramp.append(f"#{int(r1 * a + r2 * (1 - a)):02x}{int(g1 * a + g2 * (1 - a)):02x}"
+                            f"{int(b1 * a + b2 * (1 - a)):02x}")
+            self.ramps[key] = ramp
+        return self.ramps[key]
+
+    def blend(self, color1, color2, alpha):
+        return self.ramp(color1, color2)[round(min(1.0, max(0.0, alpha)) * (RAMP_STEPS - 1))]
+
+    def prepare(self, theme):
+        """Build the ramps a theme's effects use before the first frame needs them"""
+        c1, c2 = theme['highlight_colors']
+        for pair in ((theme['player_x'], theme['bg']), (theme['player_o'], theme['bg']),
+                     (theme['active_bg'], theme['text_fg']), (c1, c2), (c1, theme['button_bg']),
+                     (theme['player_x'], theme['text_bg'])):
+            self.ramp(*pair)
+
+    def add(self, key, tween):
+        self.tweens[key] = tween
+        if self.after_id is None:
+            self.after_id = self.root.after(self.TICK, self.tick)
+
+    def cancel(self, key):
+        self.tweens.pop(key, None)
+
+    def tick(self):
+        now = time.time() * 1000
+        for key, tween in list(self.tweens.items()):
+            if tween.start is None:
+                tween.start = now
+            t = (now - tween.start) / tween.duration
+            if t < 1 or tween.repeat:
+                tween.step(t % 1)
+                continue
+            tween.step(1.0)
+            # A step or done callback may have replaced the tween under this key
+            if self.tweens.get(key) is tween:
+                del self.tweens[key]
+            if tween.done:
+                tween.done()
+        self.after_id = self.root.after(self.TICK, self.tick) if self.tweens else None
 
 class TicTacToe:
     def __init__(self, root):
@@ -16,14 +105,19 @@ class TicTacToe:
         self.current_player = "X"
         self.two_player = True
         self.difficulty = 'medium'
-        self.board = [["" for _ in range(3)] for _ in range(3)]
-        self.buttons = [[None for _ in range(3)] for _ in range(3)]
+        self.board_size = 3
+        self.win_length = 3
+        self.think_time = 1.0  # seconds per hard-mode move on larger boards
+        self.buttons = []
         self.x_wins = 0
         self.o_wins = 0
         self.ties = 0
         self.settings_file = "game_settings.json"
-        self.game_history = []
+        self.history = GameHistory("game_history.db")
+        self.moves = []  # cell indices played this game, for the history
         self.undo_stack = []
+        self.ai_after = None  # pending root.after id before the computer starts
+        self.ai_job = None  # the computer move being searched, if any
         self.animation_speed = 100  # ms
         self.sounds_enabled = True
         
@@ -124,6 +218,8 @@ class TicTacToe:
         # Default to dark theme
         self.current_theme = self.themes['neon']
         self.load_settings()
+        self.animator = Animator(self.root)
+        self.board = [["" for _ in range(self.board_size)] for _ in range(self.board_size)]
         self.create_widgets()
         self.create_menu()
         self.apply_theme()
@@ -148,6 +244,9 @@ class TicTacToe:
                     self.ties = settings.get('ties', 0)
                     self.sounds_enabled = settings.get('sounds_enabled', True)
                     self.animation_speed = settings.get('animation_speed', 100)
+                    self.board_size = settings.get('board_size', 3)
+                    self.win_length = settings.get('win_length', 3)
+                    self.think_time = settings.get('think_time', 1.0)
             except json.JSONDecodeError:
                 print("Error loading settings, using defaults.")
 
@@ -160,7 +259,10 @@ class TicTacToe:
             'o_wins': self.o_wins,
             'ties': self.ties,
             'sounds_enabled': self.sounds_enabled,
-            'animation_speed': self.animation_speed
+            'animation_speed': self.animation_speed,
+            'board_size': self.board_size,
+            'win_length': self.win_length,
+            'think_time': self.think_time
         }
         with open(self.settings_file, 'w') as f:
             json.dump(settings, f)
@@ -183,6 +285,15 @@ class TicTacToe:
             )
         game_menu.add_cascade(label="Difficulty", menu=difficulty_menu)
         
+        # Board size submenu
+        board_menu = tk.Menu(game_menu, tearoff=0)
+        for size, win_length, label in BOARD_PRESETS:
+            board_menu.add_command(
+                label=label,
+                command=lambda n=size, k=win_length: self.set_board(n, k)
+            )
+        game_menu.add_cascade(label="Board", menu=board_menu)
+        
         # Undo/Redo
         game_menu.add_command(label="Undo", command=self.undo_move, accelerator="Ctrl+Z", state=tk.DISABLED)
         game_menu.add_command(label="Redo", command=self.redo_move, accelerator="Ctrl+Y", state=tk.DISABLED)
@@ -294,31 +405,8 @@ class TicTacToe:
         )
         self.canvas.grid(row=0, column=0, sticky='nsew')
         
-        # Draw the grid
-        self.draw_grid()
-        
-        # Create transparent buttons over the grid
-        for row in range(3):
-            for col in range(3):
-                btn = tk.Button(
-                    self.canvas, 
-                    text="", 
-                    font=('Arial', 40, 'bold'),
-                    width=3, 
-                    height=1,
-                    command=lambda r=row, c=col: self.button_click(r, c),
-                    relief='flat',
-                    borderwidth=0,
-                    highlightthickness=0,
-                    bg='',
-                    activebackground=self.current_theme['hover_bg'],
-                    fg=self.current_theme['button_fg']
-                )
-                # Position buttons over the grid
-                x = col * 110 + 15
-                y = row * 110 + 15
-                self.canvas.create_window(x, y, anchor='nw', window=btn, width=100, height=100)
-                self.buttons[row][col] = btn
+        # Create transparent buttons over the grid (also draws the grid)
+        self.build_board()
         
         # Scoreboard
         self.score_frame = ttk.Frame(self.main_frame)
@@ -413,27 +501,65 @@ class TicTacToe:
         )
         self.animation_indicator.pack(side=tk.RIGHT, padx=10)
 
+    def build_board(self):
+        """Create one button per cell for the current board size"""
+        self.canvas.delete("cell")
+        for row in self.buttons:
+            for btn in row:
+                btn.destroy()
+        
+        n = self.board_size
+        cell = 330 / n
+        self.buttons = [[None for _ in range(n)] for _ in range(n)]
+        for row in range(n):
+            for col in range(n):
+                btn = tk.Button(
+                    self.canvas, 
+                    text="", 
+                    font=('Arial', max(8, 120 // n), 'bold'),
+                    width=3, 
+                    height=1,
+                    command=lambda r=row, c=col: self.button_click(r, c),
+                    relief='flat',
+                    borderwidth=0,
+                    highlightthickness=0,
+                    bg='',
+                    activebackground=self.current_theme['hover_bg'],
+                    fg=self.current_theme['button_fg']
+                )
+                # Position buttons over the grid
+                x = col * cell + cell * 15 / 110
+                y = row * cell + cell * 15 / 110
+                size = cell * 100 / 110
+                self.canvas.create_window(x, y, anchor='nw', window=btn, width=size, height=size, tags="cell")
+                self.buttons[row][col] = btn
+        self.draw_grid()
+
     def draw_grid(self):
         """Draw the tic-tac-toe grid with custom styling"""
         self.canvas.delete("grid")  # Clear previous grid
         
+        n = self.board_size
+        cell = 330 / n
+        line_width = 4 if n <= 5 else 1
+        
         # Draw vertical lines
-        for i in range(1, 3):
+        for i in range(1, n):
             self.canvas.create_line(
-                i * 110, 10, 
-                i * 110, 320, 
+                i * cell, 10, 
+                i * cell, 320, 
                 fill=self.current_theme['grid_color'], 
-                width=4,
+                width=line_width,
                 tags="grid"
             )
         
         # Draw horizontal lines
-        for i in range(1, 3):
+        for i in range(1, n):
             self.canvas.create_line(
-                10, i * 110, 
-                320, i * 110, 
+                10, i * cell, 
+                320, i * cell, 
                 fill=self.current_theme['grid_color'], 
-                width=4,
+                width=line_width,
                 tags="grid"
             )
         
@@ -457,8 +583,9 @@ class TicTacToe:
     def update_status(self):
         """Update the status bar text"""
         mode = "Two Player" if self.two_player else f"Single Player ({self.difficulty.capitalize()})"
+        board = f"{self.board_size}x{self.board_size}, {self.win_length} in a row"
         sounds = "ON" if self.sounds_enabled else "OFF"
-        self.status_var.set(f"Mode: {mode} | Sounds: {sounds} | Animation: {self.animation_speed}ms")
+        self.status_var.set(f"Mode: {mode} | Board: {board} | Sounds: {sounds} | Animation: {self.animation_speed}ms")
 
     def bind_keys(self):
         """Bind keyboard shortcuts"""
@@ -467,9 +594,8 @@ class TicTacToe:
 
     def handle_key(self, pos):
         """Handle keyboard input for moves"""
-        row, col = divmod(pos, 3)
-        if 0 <= row <= 2 and 0 <= col <= 2:
-            self.button_click(row, col)
+        if self.board_size == 3:
+            self.button_click(*divmod(pos, 3))
 
     def button_click(self, row, col):
         """Handle button click event"""
@@ -479,75 +605,40 @@ class TicTacToe:
             self.make_move(row, col)
             if not self.two_player and self.current_player == "O":
                 self.toggle_buttons_state(tk.DISABLED)
-                self.root.after(800, self.computer_move)  # Delay for realism
+                self.ai_after = self.root.after(800, self.computer_move)  # Delay for realism
 
     def animate_button_click(self, row, col):
         """Animate the button click with a ripple effect"""
         btn = self.buttons[row][col]
         color = self.current_theme['player_x'] if self.current_player == "X" else self.current_theme['player_o']
-        self.ripple_effect(btn, color, 0, 5)
+        self.ripple_effect(btn, color, 5)
 
-    def ripple_effect(self, widget, color, step, max_steps):
-        """Create a ripple animation effect on the button"""
-        if step >= max_steps:
-            return
-            
-        # Calculate ripple size and opacity
-        size = 100 + step * 10
-        opacity = 1.0 - (step / max_steps)
-        
-        # Create ripple circle
+    def ripple_effect(self, widget, color, max_steps):
+        """Expand and fade a circle around the button"""
         x = widget.winfo_x() + 50
         y = widget.winfo_y() + 50
-        ripple = self.canvas.create_oval(
-            x-size/2, y-size/2, 
-            x+size/2, y+size/2,
-            outline=self.blend_colors(color, self.current_theme['bg'], opacity),
-            width=2,
-            tags="ripple"
-        )
-        
-        # Schedule next step
-        self.root.after(self.animation_speed, 
-                       lambda: self.update_ripple(ripple, widget, color, step+1, max_steps))
-
-    def update_ripple(self, ripple, widget, color, step, max_steps):
-        """Update the ripple animation"""
-        if step >= max_steps:
-            self.canvas.delete(ripple)
-            return
-            
-        # Update ripple size and opacity
-        size = 100 + step * 10
-        opacity = 1.0 - (step / max_steps)
-        
-        x = widget.winfo_x() + 50
-        y = widget.winfo_y() + 50
-        self.canvas.coords(ripple, 
-                          x-size/2, y-size/2, 
-                          x+size/2, y+size/2)
-        self.canvas.itemconfig(ripple, 
-                             outline=self.blend_colors(color, self.current_theme['bg'], opacity))
-        
-        # Schedule next update
-        self.root.after(self.animation_speed, 
-                       lambda: self.update_ripple(ripple, widget, color, step+1, max_steps))
+        ramp = self.animator.ramp(color, self.current_theme['bg'])
+        ripple = self.canvas.create_oval(x-50, y-50, x+50, y+50, outline=ramp[-1], width=2, tags="ripple")
+
+        def step(t):
+            size = 100 + t * max_steps * 10
+            self.canvas.coords(ripple, x-size/2, y-size/2, x+size/2, y+size/2)
+            self.canvas.itemconfig(ripple, outline=ramp[round((1 - t) * (RAMP_STEPS - 1))])
+
+        self.animator.add(("ripple", ripple), Tween(
+            max_steps * self.animation_speed, step, lambda: self.canvas.delete(ripple)))
 
     def blend_colors(self, color1, color2, alpha):
         """Blend two colors with a given alpha value"""
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-        r = int(r1 * alpha + r2 * (1 - alpha))
-        g = int(g1 * alpha + g2 * (1 - alpha))
-        b = int(b1 * alpha + b2 * (1 - alpha))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return self.animator.blend(color1, color2, alpha)
 
     def make_move(self, row, col):
         """Process a player move"""
         # Save state for undo
         self.undo_stack.append({
             'board': [row[:] for row in self.board],
-            'player': self.current_player
+            'player': self.current_player,
+            'moves': self.moves[:]
         })
         
         # Clear redo stack
@@ -559,6 +650,7 @@ class TicTacToe:
             fg=self.current_theme['player_x'] if self.current_player == "X" else self.current_theme['player_o']
         )
         self.board[row][col] = self.current_player
+        self.moves.append(row * self.board_size + col)
         
         # Enable undo button
         self.undo_btn.config(state=tk.NORMAL)
@@ -575,149 +667,81 @@ class TicTacToe:
             self.animate_turn_label()
 
     def computer_move(self):
-        """Computer makes a move based on difficulty"""
-        self.turn_label.config(text="Computer thinking...")
-        self.root.update()
-        
-        if self.difficulty == 'easy':
-            self.computer_move_easy()
-        elif self.difficulty == 'medium':
-            self.computer_move_medium()
-        elif self.difficulty == 'hard':
-            self.computer_move_hard()
-            
+        """Start the computer's move in a worker thread; finish_computer_move plays it"""
+        self.ai_after = None
+        strategy = {
+            'easy': self.computer_move_easy,
+            'medium': self.computer_move_medium,
+            'hard': self.computer_move_hard,
+        }[self.difficulty]
+        game = engine.Game.from_board(self.board, self.win_length)
+        job = {
+            'stop': threading.Event(),
+            'progress': {},
+            'result': [],
+            'started': time.time()
+        }
+        job['thread'] = threading.Thread(
+            target=lambda: job['result'].append(strategy(game, job['stop'], job['progress'])),
+            daemon=True
+        )
+        self.ai_job = job
+        job['thread'].start()
+        self.show_thinking(job)
+        self.root.after(20, self.finish_computer_move, job)
+
+    def finish_computer_move(self, job):
+        """Poll the worker from the Tk loop and play its move once it is done"""
+        if job is not self.ai_job:
+            return  # Cancelled by a reset or undo
+        if job['thread'].is_alive():
+            self.show_thinking(job)
+            self.root.after(20, self.finish_computer_move, job)
+            return
+        self.ai_job = None
+        if job['result'] and job['result'][0] is not None:
+            self.make_move(*divmod(job['result'][0], self.board_size))
         self.toggle_buttons_state(tk.NORMAL)
 
-    def computer_move_easy(self):
+    def show_thinking(self, job):
+        """Animated "thinking" label with the search depth reached so far"""
+        dots = "." * (1 + int((time.time() - job['started']) * 3) % 3)
+        depth = job['progress'].get('depth')
+        detail = f" (depth {depth})" if depth else ""
+        self.turn_label.config(text=f"Computer thinking{dots}{detail}")
+
+    def cancel_computer_move(self):
+        """Stop a scheduled or running computer move and drop its result"""
+        if self.ai_after is not None:
+            self.root.after_cancel(self.ai_after)
+            self.ai_after = None
+        if self.ai_job is not None:
+            self.ai_job['stop'].set()
+            self.ai_job = None
+            self.toggle_buttons_state(tk.NORMAL)
+
+    def computer_move_easy(self, game, stop=None, progress=None):
         """Easy computer - random moves"""
-        empty = [(r, c) for r in range(3) for c in range(3) if self.board[r][c] == ""]
-        if empty:
-            row, col = random.choice(empty)
-            self.make_move(row, col)
+        return engine.random_move(game)
 
-    def computer_move_medium(self):
-        """Medium computer - blocks wins when possible"""
-        # Try to win
-        for row in range(3):
-            for col in range(3):
-                if self.board[row][col] == "":
-                    self.board[row][col] = "O"
-                    if self.check_winner():
-                        self.board[row][col] = ""
-                        self.make_move(row, col)
-                        return
-                    self.board[row][col] = ""
-        
-        # Block player win
-        for row in range(3):
-            for col in range(3):
-                if self.board[row][col] == "":
-                    self.board[row][col] = "X"
-                    if self.check_winner():
-                        self.board[row][col] = ""
-                        self.make_move(row, col)
-                        return
-                    self.board[row][col] = ""
-        
-        # Take center if available
-        if self.board[1][1] == "":
-            self.make_move(1, 1)
-            return
-            
-        # Take a corner
-        corners = [(0, 0), (0, 2), (2, 0), (2, 2)]
-        random.shuffle(corners)
-        for row, col in corners:
-            if self.board[row][col] == "":
-                self.make_move(row, col)
-                return
-                
-        # Take any available space
-        self.computer_move_easy()
-
-    def computer_move_hard(self):
-        """Hard computer - uses minimax algorithm"""
-        best_move = self.get_best_move()
-        if best_move:
-            self.make_move(best_move[0], best_move[1])
-
-    def get_best_move(self):
-        best_score = -float('inf')
-        best_move = None
-        alpha = -float('inf')
-        beta = float('inf')
-        for row in range(3):
-            for col in range(3):
-                if self.board[row][col] == "":
-                    self.board[row][col] = "O"
-                    score = self.minimax(False, alpha, beta)
-                    self.board[row][col] = ""
-                    if score > best_score:
-                        best_score = score
-                        best_move = (row, col)
-                    alpha = max(alpha, best_score)
-                    if beta <= alpha:
-                        break
-        return best_move
-
-    def minimax(self, is_maximizing, alpha, beta):
-        winner = self.get_winner()
-        if winner == "O": return 1
-        if winner == "X": return -1
-        if self.is_tie(): return 0
-
-        if is_maximizing:
-            best_score = -float('inf')
-            for row in range(3):
-                for col in range(3):
-                    if self.board[row][col] == "":
-                        self.board[row][col] = "O"
-                        score = self.minimax(False, alpha, beta)
-                        self.board[row][col] = ""
-                        best_score = max(score, best_score)
-                        alpha = max(alpha, best_score)
-                        if beta <= alpha:
-                            break
-                if beta <= alpha:
-                    break
-            return best_score
-        else:
-            best_score = float('inf')
-            for row in range(3):
-                for col in range(3):
-                    if self.board[row][col] == "":
-                        self.board[row][col] = "X"
-                        score = self.minimax(True, alpha, beta)
-                        self.board[row][col] = ""
-                        best_score = min(score, best_score)
-                        beta = min(beta, best_score)
-                        if beta <= alpha:
-                            break
-                if beta <= alpha:
-                    break
-            return best_score
-
-    def get_winner(self):
-        return self.board[self.check_winner()[0][0]][self.check_winner()[0][1]] if self.check_winner() else None
+    def computer_move_medium(self, game, stop=None, progress=None):
+        """Medium computer - wins or blocks when possible, else centre and corners"""
+        return engine.greedy_move(game)
+
+    def computer_move_hard(self, game, stop=None, progress=None):
+        """Hard computer - perfect play on 3x3, time-limited search on larger boards"""
+        move, _ = engine.best_move(game, self.think_time, stop, progress)
+        return move
 
     def check_winner(self):
-        # Check rows
-        for row in range(3):
-            if self.board[row][0] == self.board[row][1] == self.board[row][2] != "":
-                return [(row, 0), (row, 1), (row, 2)]
-        # Check columns
-        for col in range(3):
-            if self.board[0][col] == self.board[1][col] == self.board[2][col] != "":
-                return [(0, col), (1, col), (2, col)]
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != "":
-            return [(0, 0), (1, 1), (2, 2)]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != "":
-            return [(0, 2), (1, 1), (2, 0)]
-        return None
+        if self.board_size != 3 or self.win_length != 3:
+            return engine.Game.from_board(self.board, self.win_length).winning_cells()
+        x_mask, o_mask = engine.from_board(self.board)
+        line = engine.winning_line(x_mask) or engine.winning_line(o_mask)
+        return engine.cells_of(line) if line else None
 
     def is_tie(self):
-        return all(cell != "" for row in self.board for cell in row)
+        return all(cell for row in self.board for cell in row)
 
     def handle_win(self, winner_cells):
         self.highlight_winner(winner_cells)
@@ -729,11 +753,7 @@ class TicTacToe:
             self.o_wins += 1
             self.o_score.config(text=str(self.o_wins))
         self.save_settings()
-        self.game_history.append({
-            'winner': winner,
-            'board': [row[:] for row in self.board],
-            'date': time.strftime("%Y-%m-%d %H:%M")
-        })
+        self.record_game(winner)
         self.root.after(1000, lambda: messagebox.showinfo("Game Over", f"Player {winner} wins!"))
         self.root.after(1200, self.reset_game)
 
@@ -741,41 +761,48 @@ class TicTacToe:
         self.ties += 1
         self.tie_score.config(text=str(self.ties))
         self.save_settings()
-        self.game_history.append({
-            'winner': 'tie',
-            'board': [row[:] for row in self.board],
-            'date': time.strftime("%Y-%m-%d %H:%M")
-        })
+        self.record_game('tie')
         self.root.after(1000, lambda: messagebox.showinfo("Game Over", "It's a tie!"))
         self.root.after(1200, self.reset_game)
 
+    def record_game(self, winner):
+        """Append the finished game to the history database"""
+        self.history.record(
+            winner, self.moves,
+            board_size=self.board_size,
+            win_length=self.win_length,
+            mode='two_player' if self.two_player else 'single',
+            difficulty=None if self.two_player else self.difficulty
+        )
+
     def highlight_winner(self, winner_cells):
         color1, color2 = self.current_theme['highlight_colors']
         self.pulse_winner_cells(winner_cells, color1, color2)
 
-    def pulse_winner_cells(self, cells, color1, color2, count=0, max_count=8):
-        if count >= max_count:
+    def pulse_winner_cells(self, cells, color1, color2, max_count=8):
+        ramp = self.animator.ramp(color1, color2)
+
+        def step(t):
+            alpha = (math.sin(t * max_count / 2) + 1) / 2
+            for row, col in cells:
+                self.buttons[row][col].config(bg=ramp[round(alpha * (RAMP_STEPS - 1))])
+
+        def done():
             # Draw a permanent highlight
             for row, col in cells:
                 self.buttons[row][col].config(
                     bg=self.blend_colors(color1, self.current_theme['button_bg'], 0.3)
                 )
-            return
-            
-        alpha = (math.sin(count / 2) + 1) / 2
-        blended_color = self.blend_colors(color1, color2, alpha)
-        
-        for row, col in cells:
-            self.buttons[row][col].config(bg=blended_color)
-            
-        self.root.after(self.animation_speed, 
-                       lambda: self.pulse_winner_cells(cells, color1, color2, count + 1))
+
+        self.animator.add("winner", Tween(max_count * self.animation_speed, step, done))
 
     def reset_game(self):
+        self.cancel_computer_move()
+        self.animator.cancel("winner")
         self.current_player = "X"
-        self.board = [["" for _ in range(3)] for _ in range(3)]
-        for row in range(3):
-            for col in range(3):
+        self.board = [["" for _ in range(self.board_size)] for _ in range(self.board_size)]
+        for row in range(self.board_size):
+            for col in range(self.board_size):
                 self.buttons[row][col].config(
                     text="", 
                     bg=self.current_theme['button_bg'],
@@ -784,6 +811,7 @@ class TicTacToe:
         self.toggle_buttons_state(tk.NORMAL)
         self.undo_btn.config(state=tk.DISABLED)
         self.undo_stack = []
+        self.moves = []
         self.animate_turn_label()
         self.play_sound("reset")
 
@@ -806,6 +834,16 @@ class TicTacToe:
         self.save_settings()
         messagebox.showinfo("Difficulty", f"Difficulty set to {difficulty.capitalize()}")
 
+    def set_board(self, size, win_length):
+        self.board_size = size
+        self.win_length = win_length
+        self.board = [["" for _ in range(size)] for _ in range(size)]
+        self.build_board()
+        self.apply_theme()
+        self.reset_game()
+        self.update_status()
+        self.save_settings()
+
     def set_theme(self, theme_name):
         self.current_theme = self.themes[theme_name]
         self.theme_label.config(text=self.current_theme['name'])
@@ -843,14 +881,17 @@ class TicTacToe:
         self.tie_score.config(foreground=self.current_theme['text_fg'])
         
         # Configure buttons
-        for row in range(3):
-            for col in range(3):
+        for row in range(self.board_size):
+            for col in range(self.board_size):
                 self.buttons[row][col].config(
                     bg=self.current_theme['button_bg'],
                     fg=self.current_theme['button_fg'],
                     activebackground=self.current_theme['hover_bg']
                 )
         
+        # Colour ramps for this theme's animations
+        self.animator.prepare(self.current_theme)
+        
         # Redraw grid
         self.canvas.config(bg=self.current_theme['bg'])
         self.draw_grid()
@@ -862,20 +903,18 @@ class TicTacToe:
         """Animate the turn label with a pulsing effect"""
         text = f"Player {self.current_player}'s turn" if self.two_player or self.current_player == "X" else "Computer's turn"
         self.turn_label.config(text=text)
-        self.pulse_effect(self.turn_label, self.current_theme['active_bg'], self.current_theme['text_fg'], 0, 6)
+        self.pulse_effect(self.turn_label, self.current_theme['active_bg'], self.current_theme['text_fg'], 6)
 
-    def pulse_effect(self, widget, color1, color2, count=0, max_count=6):
+    def pulse_effect(self, widget, color1, color2, max_count=6):
         """Create a pulsing animation effect"""
-        if count >= max_count:
-            widget.config(foreground=color2)
-            return
-            
-        alpha = (math.sin(count) + 1) / 2
-        blended_color = self.blend_colors(color1, color2, alpha)
-        widget.config(foreground=blended_color)
-        
-        self.root.after(self.animation_speed, 
-                       lambda: self.pulse_effect(widget, color1, color2, count + 1))
+        ramp = self.animator.ramp(color1, color2)
+
+        def step(t):
+            alpha = (math.sin(t * max_count) + 1) / 2
+            widget.config(foreground=ramp[round(alpha * (RAMP_STEPS - 1))])
+
+        self.animator.add(("pulse", str(widget)), Tween(
+            max_count * self.animation_speed, step, lambda: widget.config(foreground=color2)))
 
     def reset_scores(self):
         """Reset all scores and history"""
@@ -883,7 +922,7 @@ class TicTacToe:
         self.x_score.config(text="0")
         self.o_score.config(text="0")
         self.tie_score.config(text="0")
-        self.game_history = []
+        self.history.clear()
         self.save_settings()
         messagebox.showinfo("Scores Reset", "All scores have been reset to zero")
 
@@ -891,6 +930,7 @@ class TicTacToe:
         """Undo the last move"""
         if not self.undo_stack:
             return
+        self.cancel_computer_move()
             
         # Get last state
         state = self.undo_stack.pop()
@@ -898,10 +938,11 @@ class TicTacToe:
         # Restore board state
         self.board = state['board']
         self.current_player = state['player']
+        self.moves = state['moves']
         
         # Update UI
-        for row in range(3):
-            for col in range(3):
+        for row in range(self.board_size):
+            for col in range(self.board_size):
                 self.buttons[row][col].config(
                     text=self.board[row][col] if self.board[row][col] else "",
                     fg=self.current_theme['player_x'] if self.board[row][col] == "X" 
@@ -968,9 +1009,9 @@ class TicTacToe:
         """Show game instructions"""
         messagebox.showinfo("How to Play",
             "TIC TAC TOE++ ULTRA - INSTRUCTIONS\n\n"
-            "1. Click a square or use keys 1-9 (numpad layout) to place your mark (X)\n"
-            "2. Get 3 in a row horizontally, vertically, or diagonally to win\n"
-            "3. In single player mode, choose difficulty from the Game menu\n"
+            "1. Click a square (or use keys 1-9 on the 3x3 board) to place your mark (X)\n"
+            f"2. Get {self.win_length} in a row horizontally, vertically, or diagonally to win\n"
+            "3. In single player mode, choose difficulty and board size from the Game menu\n"
             "4. Explore different themes from the Themes menu\n"
             "5. Use Undo to take back moves (Ctrl+Z)\n"
             "6. View game statistics from the Help menu\n"
@@ -978,17 +1019,44 @@ class TicTacToe:
 
     def show_stats(self):
         """Show game statistics"""
-        stats = f"Games Played: {len(self.game_history)}\n"
+        stats = f"Games Played: {self.history.count()}\n"
         stats += f"X Wins: {self.x_wins}\n"
         stats += f"O Wins: {self.o_wins}\n"
         stats += f"Ties: {self.ties}\n\n"
-        
-        if self.game_history:
+
+        # Aggregates come straight from SQLite; the games are never loaded
+        by_difficulty = self.history.win_rate_by_difficulty()
+        if by_difficulty:
+            stats += "Your Win Rate vs Computer:\n"
+            for difficulty in ('easy', 'medium', 'hard'):
+                if difficulty in by_difficulty:
+                    games, x_wins, o_wins, ties = by_difficulty[difficulty]
+                    stats += (f"{difficulty.capitalize()}: {100 * x_wins / games:.0f}% "
+                              f"({x_wins}W {o_wins}L {ties}T)\n")
+            stats += "\n"
+
+        openings = self.history.common_openings(self.board_size, self.win_length)
+        if openings:
+            stats += f"Common Openings ({self.board_size}x{self.board_size}):\n"
+            for (cell,), games, x_share in openings:
+                row, col = divmod(cell, self.board_size)
+                stats += f"Row {row + 1}, Col {col + 1}: {games} games, X won {100 * x_share:.0f}%\n"
+            stats += "\n"
+
+        lengths = self.history.average_length()
+        if lengths:
+            stats += "Average Game Length:\n"
+            for (size, win_length), moves in lengths.items():
+                stats += f"{size}x{size}, {win_length} in a row: {moves:.1f} moves\n"
+            stats += "\n"
+
+        recent = self.history.recent(5)
+        if recent:
             stats += "Recent Games:\n"
-            for i, game in enumerate(self.game_history[-5:], 1):
-                winner = "X" if game['winner'] == "X" else "O" if game['winner'] == "O" else "Tie"
-                stats += f"{i}. {game['date']} - {winner}\n"
-        
+            for i, (date, winner, size) in enumerate(recent, 1):
+                winner = "Tie" if winner == "tie" else winner
+                stats += f"{i}. {date} - {winner} ({size}x{size})\n"
+
         messagebox.showinfo("Game Statistics", stats)
 
     def show_about(self):
@@ -1009,20 +1077,22 @@ class TicTacToe:
         messagebox.showinfo("About", about_text)
 
     def animate_background(self):
-        """Create subtle background animation"""
-        if not self.running and not self.paused:
-            # Animate the lightning bolt
-            text = self.animation_indicator.cget("text")
-            if text == "⚡":
-                self.animation_indicator.config(text="⚡")
-            else:
-                self.animation_indicator.config(text="⚡")
-        
-        self.root.after(500, self.animate_background)
+        """Slowly pulse the lightning bolt in the status bar"""
+        def step(t):
+            ramp = self.animator.ramp(self.current_theme['player_x'], self.current_theme['text_bg'])
+            color = ramp[round((math.cos(t * 2 * math.pi) + 1) / 2 * (RAMP_STEPS - 1))]
+            if color != self.indicator_color:
+                self.indicator_color = color
+                self.animation_indicator.config(foreground=color)
+
+        self.indicator_color = None
+        self.animator.add("background", Tween(2000, step, repeat=True))
 
     def quit_game(self):
         """Quit the game"""
+        self.cancel_computer_move()
         self.save_settings()
+        self.history.close()
         self.root.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""Self-play tournament for the tic-tac-toe computer players.
+
+Plays every pairing of the easy, medium and hard strategies against each
+other without a window, swapping who moves first each game, and reports
+win/draw/loss rates (for the first strategy of each pairing), nodes
+searched and per-move latency percentiles.
+
+    python tic_tac_toe_bench.py --games 200 --workers 4
+    python tic_tac_toe_bench.py --size 7 --win-length 5 --pairs hard:medium --think-time 0.2
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import itertools
+import multiprocessing
+import tic_tac_toe_engine as engine
+
+STRATEGIES = ("easy", "medium", "hard")
+
+
+def choose(name, game, rng, think_time):
+    """The same choices as the Tk client's computer_move_*; returns (cell, nodes)."""
+    if name == "easy":
+        return engine.random_move(game, rng), 0
+    if name == "medium":
+        return engine.greedy_move(game, rng), 0
+    move, stats = engine.best_move(game, think_time)
+    return move, stats["nodes"]
+
+
+def play_game(job):
+    """Play one game; job is (x strategy, o strategy, size, win length, think time, seed)."""
+    x, o, size, win_length, think_time, seed = job
+    names = (x, o)
+    rng = random.Random(seed)
+    game = engine.Game(size, win_length)
+    # Start every game with a cold 3x3 solver table so its node counts are
+    # per game rather than whatever earlier games left uncached
+    engine.solver.table.clear()
+    latency = ([], [])
+    nodes = [0, 0]
+    while game.winner is None and not game.is_full():
+        player = game.turn
+        started = time.perf_counter()
+        move, searched = choose(names[player], game, rng, think_time)
+        latency[player].append(time.perf_counter() - started)
+        nodes[player] += searched
+        game.play(move)
+    return {
+        "x": names[0],
+        "o": names[1],
+        "winner": game.winner,
+        "moves": len(game.moves),
+        "latency": latency,
+        "nodes": nodes,
+    }
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def tournament(pairs, games, size=3, win_length=3, think_time=1.0, workers=1, seed=0):
+    jobs = []
+    for a, b in pairs:
+        for i in range(games):
+            # Alternate colours so neither side always moves first
+            x, o = (a, b) if i % 2 == 0 else (b, a)
+            jobs.append((x, o, size, win_length, think_time, seed + len(jobs)))
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(play_game, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+    else:
+        results = list(map(play_game, jobs))
+
+    rows = []
+    for (a, b), chunk in zip(pairs, (results[i:i + games] for i in range(0, len(results), games))):
+        row = {"pair": f"{a} vs {b}", "games": games, "wins": 0, "draws": 0, "losses": 0,
+               "moves": sum(r["moves"] for r in chunk) / games}
+        # Keyed by side, not strategy, so a mirror pairing keeps both apart
+        latency = {"a": [], "b": []}
+        nodes = {"a": 0, "b": 0}
+        for i, r in enumerate(chunk):
+            a_player = i % 2
+            if r["winner"] is None:
+                row["draws"] += 1
+            elif r["winner"] == a_player:
+                row["wins"] += 1
+            else:
+                row["losses"] += 1
+            for player in (0, 1):
+                side = "a" if player == a_player else "b"
+                latency[side].extend(r["latency"][player])
+                nodes[side] += r["nodes"][player]
+        for side, name in (("a", a), ("b", b)):
+            moves = latency[side]
+            row[side] = {
+                "strategy": name,
+                "nodes_per_move": round(nodes[side] / len(moves), 1) if moves else 0,
+                "p50_ms": round(percentile(moves, 50) * 1000, 3),
+                "p95_ms": round(percentile(moves, 95) * 1000, 3),
+                "p99_ms": round(percentile(moves, 99) * 1000, 3),
+            }
+        rows.append(row)
+    return rows
+
+
+def parse_pairs(text):
+    pairs = []
+    for part in text.split(","):
+        a, _, b = part.partition(":")
+        if a not in STRATEGIES or b not in STRATEGIES:
+            raise argparse.ArgumentTypeError(f"Unknown pairing {part!r}; use e.g. hard:medium")
+        pairs.append((a, b))
+    return pairs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tic-tac-toe AI self-play tournament.")
+    parser.add_argument("--games", type=int, default=100, help="games per pairing")
+    parser.add_argument("--pairs", type=parse_pairs,
+                        default=list(itertools.combinations_with_replacement(STRATEGIES, 2)),
+                        help="comma-separated a:b pairings (default: every pairing)")
+    parser.add_argument("--size", type=int, default=3, help="board size")
+    parser.add_argument("--win-length", type=int, default=3, help="stones in a row to win")
+    parser.add_argument("--think-time", type=float, default=1.0, help="hard-mode seconds per move")
+    parser.add_argument("--workers", type=int, default=1, help="game processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    rows = tournament(args.pairs, args.games, args.size, args.win_length,
+                      args.think_time, args.workers, args.seed)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'pairing':<17} {'win %':>6} {'draw %':>7} {'loss %':>7} {'moves':>6}   "
+          f"{'strategy':<8} {'nodes/mv':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for row in rows:
+        pct = lambda n: f"{100 * n / row['games']:.1f}"
+        for i, side in enumerate((row["a"], row["b"])):
+            head = (f"{row['pair']:<17} {pct(row['wins']):>6} {pct(row['draws']):>7} "
+                    f"{pct(row['losses']):>7} {row['moves']:>6.1f}" if i == 0 else " " * 48)
+            print(f"{head}   {side['strategy']:<8} {side['nodes_per_move']:>9} "
+                  f"{side['p50_ms']:>8} {side['p95_ms']:>8} {side['p99_ms']:>8}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
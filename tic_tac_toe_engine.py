@@ -0,0 +1,451 @@
+"""Bitboard tic-tac-toe engine used by tic tac toe.py.
+
+A position is two 9-bit masks, one per player, with bit row * 3 + col set
+for each occupied cell.  Wins are checked against the eight line masks and
+the perfect-play search memoises every position under the smallest of its
+eight rotations and reflections, so the whole game tree is a few hundred
+table entries.
+
+Larger boards (N x N with K in a row, e.g. 15x15 gomoku) use Game, which
+keeps incremental per-window threat counts, and Searcher, a time-limited
+iterative-deepening alpha-beta search.
+"""
+
+import time
+import random
+
+FULL = 0x1FF
+CELLS = range(9)
+
+WIN_MASKS = tuple(
+    sum(1 << i for i in line) for line in (
+        (0, 1, 2), (3, 4, 5), (6, 7, 8),
+        (0, 3, 6), (1, 4, 7), (2, 5, 8),
+        (0, 4, 8), (2, 4, 6),
+    )
+)
+
+# The board's symmetry group as cell permutations: new cell -> old cell
+_ROTATE = (6, 3, 0, 7, 4, 1, 8, 5, 2)
+_MIRROR = (2, 1, 0, 5, 4, 3, 8, 7, 6)
+
+
+def _compose(a, b):
+    return tuple(b[a[i]] for i in CELLS)
+
+
+def _symmetries():
+    perms = [tuple(CELLS)]
+    for _ in range(3):
+        perms.append(_compose(perms[-1], _ROTATE))
+    return perms + [_compose(p, _MIRROR) for p in perms]
+
+
+def _mask_table(perm):
+    return [sum(1 << i for i in CELLS if mask >> perm[i] & 1) for mask in range(FULL + 1)]
+
+
+SYMMETRY_TABLES = [_mask_table(p) for p in _symmetries()]
+
+
+def bit(row, col):
+    return 1 << (row * 3 + col)
+
+
+def cells_of(mask):
+    return [divmod(i, 3) for i in CELLS if mask >> i & 1]
+
+
+def from_board(board, x="X", o="O"):
+    """Convert a 3x3 list of strings into (x_mask, o_mask)."""
+    xm = om = 0
+    for row in range(3):
+        for col in range(3):
+            if board[row][col] == x:
+                xm |= bit(row, col)
+            elif board[row][col] == o:
+                om |= bit(row, col)
+    return xm, om
+
+
+def winning_line(mask):
+    """The first win mask fully covered by mask, or 0."""
+    for line in WIN_MASKS:
+        if mask & line == line:
+            return line
+    return 0
+
+
+def is_full(xm, om):
+    return xm | om == FULL
+
+
+def canonical(me, them):
+    """The smallest (me, them) pair over the eight board symmetries."""
+    return min((t[me] << 9) | t[them] for t in SYMMETRY_TABLES)
+
+
+class Solver:
+    """Perfect play with a symmetry-reduced transposition table.
+
+    Scores are from the side to move: positive wins, negative loses, 0 draws;
+    quicker wins and slower losses score further from zero.
+    """
+
+    def __init__(self):
+        self.table = {}
+        self.nodes = 0
+
+    def score(self, me, them):
+        key = canonical(me, them)
+        cached = self.table.get(key)
+        if cached is not None:
+            return cached
+        self.nodes += 1
+        empty = FULL & ~(me | them)
+        if not empty:
+            value = 0
+        else:
+            value = -10
+            for i in CELLS:
+                if empty >> i & 1:
+                    mine = me | 1 << i
+                    if winning_line(mine):
+                        # Win now; the remaining empty squares reward speed
+                        result = bin(empty).count("1")
+                    else:
+                        result = -self.score(them, mine)
+                    if result > value:
+                        value = result
+        self.table[key] = value
+        return value
+
+    def move_scores(self, me, them):
+        """{cell index: score} for every legal move of the side to move."""
+        empty = FULL & ~(me | them)
+        scores = {}
+        for i in CELLS:
+            if empty >> i & 1:
+                mine = me | 1 << i
+                if winning_line(mine):
+                    scores[i] = bin(empty).count("1")
+                else:
+                    scores[i] = -self.score(them, mine)
+        return scores
+
+    def best_move(self, me, them):
+        """(row, col) of the best move, the first in reading order on ties."""
+        scores = self.move_scores(me, them)
+        if not scores:
+            return None
+        best = max(scores, key=lambda i: (scores[i], -i))
+        return divmod(best, 3)
+
+
+solver = Solver()
+
+
+# ----- N x N, K in a row -----
+
+WIN_SCORE = 10 ** 9
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+_zobrist_keys = {}
+
+
+def _zobrist(cells):
+    if cells not in _zobrist_keys:
+        rng = random.Random(cells)
+        _zobrist_keys[cells] = [(rng.getrandbits(64), rng.getrandbits(64)) for _ in range(cells)]
+    return _zobrist_keys[cells]
+
+
+class Game:
+    """An N x N board where K in a row wins, for players 0 (X) and 1 (O).
+
+    Keeps a stone count per player for every K-cell window (the threat
+    table), a heuristic score and a Zobrist hash, all updated by play()
+    and undo() from the windows through the changed cell only.
+    """
+
+    def __init__(self, size=3, win_length=3):
+        if not 1 <= win_length <= size:
+            raise ValueError(f"Win length {win_length} does not fit a {size}x{size} board")
+        self.size = size
+        self.win_length = win_length
+        n = size * size
+        self.lines = []
+        self.lines_through = [[] for _ in range(n)]
+        for row in range(size):
+            for col in range(size):
+                for dr, dc in DIRECTIONS:
+                    end_r, end_c = row + dr * (win_length - 1), col + dc * (win_length - 1)
+                    if 0 <= end_r < size and 0 <= end_c < size:
+                        line = tuple((row + dr * i) * size + col + dc * i for i in range(win_length))
+                        for cell in line:
+                            self.lines_through[cell].append(len(self.lines))
+                        self.lines.append(line)
+        # A window with c stones of one colour and none of the other is worth 8**c
+        self.weights = [0] + [8 ** c for c in range(1, win_length + 1)]
+        self.radius = 2 if size > 5 else size
+        self.neighbours = [
+            tuple(r * size + c
+                  for r in range(max(0, row - self.radius), min(size, row + self.radius + 1))
+                  for c in range(max(0, col - self.radius), min(size, col + self.radius + 1))
+                  if (r, c) != (row, col))
+            for row in range(size) for col in range(size)
+        ]
+        self.keys = _zobrist(n)
+        self.cells = [None] * n
+        self.counts = [[0, 0] for _ in self.lines]
+        self.near = [0] * n
+        self.moves = []
+        self.turn = 0
+        self.score = 0
+        self.hash = 0
+        self.winner = None
+
+    @classmethod
+    def from_board(cls, board, win_length, marks=("X", "O")):
+        """Build a game from a list of rows of marks ("" for empty)."""
+        game = cls(len(board), win_length)
+        stones = [[], []]
+        for row, line in enumerate(board):
+            for col, mark in enumerate(line):
+                if mark:
+                    stones[marks.index(mark)].append(row * game.size + col)
+        # Replay alternately so the side to move comes out right
+        for i in range(max(len(stones[0]), len(stones[1]))):
+            for player in (0, 1):
+                if i < len(stones[player]):
+                    game.turn = player
+                    game.play(stones[player][i])
+        game.turn = 0 if len(stones[0]) <= len(stones[1]) else 1
+        return game
+
+    def _value(self, line):
+        mine, theirs = self.counts[line]
+        if not theirs:
+            return self.weights[mine]
+        if not mine:
+            return -self.weights[theirs]
+        return 0
+
+    def play(self, cell):
+        player = self.turn
+        self.cells[cell] = player
+        self.moves.append(cell)
+        self.hash ^= self.keys[cell][player]
+        for line in self.lines_through[cell]:
+            before = self._value(line)
+            self.counts[line][player] += 1
+            self.score += self._value(line) - before
+            if self.counts[line][player] == self.win_length:
+                self.winner = player
+        for other in self.neighbours[cell]:
+            self.near[other] += 1
+        self.turn = 1 - player
+
+    def undo(self):
+        cell = self.moves.pop()
+        player = self.cells[cell]
+        self.cells[cell] = None
+        self.hash ^= self.keys[cell][player]
+        for line in self.lines_through[cell]:
+            before = self._value(line)
+            self.counts[line][player] -= 1
+            self.score += self._value(line) - before
+        for other in self.neighbours[cell]:
+            self.near[other] -= 1
+        self.winner = None
+        self.turn = player
+
+    def is_full(self):
+        return len(self.moves) == len(self.cells)
+
+    def legal_moves(self):
+        return [i for i, v in enumerate(self.cells) if v is None]
+
+    def candidate_moves(self):
+        """Empty cells within reach of a stone; the centre on an empty board."""
+        if not self.moves:
+            return [(self.size // 2) * self.size + self.size // 2]
+        return [i for i, v in enumerate(self.cells) if v is None and self.near[i]]
+
+    def evaluate(self):
+        """Heuristic score for the side to move."""
+        return self.score if self.turn == 0 else -self.score
+
+    def move_priority(self, cell):
+        """How much a move extends the mover's windows and blocks the opponent's."""
+        me = self.turn
+        weights = self.weights
+        total = 0
+        for line in self.lines_through[cell]:
+            counts = self.counts[line]
+            if not counts[1 - me]:
+                total += weights[counts[me] + 1]
+            if not counts[me]:
+                total += weights[counts[1 - me] + 1]
+        return total
+
+    def wins_with(self, cell, player):
+        k = self.win_length
+        return any(self.counts[line][player] == k - 1 and not self.counts[line][1 - player]
+                   for line in self.lines_through[cell])
+
+    def winning_cells(self):
+        for line, counts in zip(self.lines, self.counts):
+            if self.win_length in counts:
+                return [divmod(cell, self.size) for cell in line]
+        return None
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class Searcher:
+    """Iterative-deepening alpha-beta (negamax) with a transposition table.
+
+    Moves are ordered by the table's best move, then move_priority();
+    on boards above 5x5 only the most promising max_branch moves are tried.
+    The search stops when time_budget seconds pass or stop (an Event) is set
+    and answers with the best move of the deepest finished iteration.
+    progress, if given, is a dict updated with depth, nodes and move after
+    each iteration so another thread can report on the search.
+    """
+
+    def __init__(self, time_budget=1.0, max_depth=None, max_branch=12, stop=None, progress=None):
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.max_branch = max_branch
+        self.stop = stop
+        self.progress = progress
+        self.table = {}
+        self.nodes = 0
+
+    def _ordered(self, game, hint):
+        moves = game.candidate_moves()
+        moves.sort(key=game.move_priority, reverse=True)
+        if game.size > 5:
+            moves = moves[:self.max_branch]
+        if hint is not None and hint in moves:
+            moves.remove(hint)
+            moves.insert(0, hint)
+        return moves
+
+    def _check_time(self):
+        if time.perf_counter() > self.deadline or (self.stop is not None and self.stop.is_set()):
+            raise SearchTimeout
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        self.nodes += 1
+        if not self.nodes & 511:
+            self._check_time()
+        if game.winner is not None:
+            return -(WIN_SCORE - ply)
+        if game.is_full():
+            return 0
+        if depth == 0:
+            return game.evaluate()
+
+        entry = self.table.get(game.hash)
+        hint = None
+        if entry is not None:
+            entry_depth, flag, value, hint = entry
+            if entry_depth >= depth:
+                if flag == 0:
+                    return value
+                if flag < 0 and value <= alpha:
+                    return value
+                if flag > 0 and value >= beta:
+                    return value
+
+        original_alpha = alpha
+        best, best_move = -WIN_SCORE - 1, None
+        for move in self._ordered(game, hint):
+            game.play(move)
+            try:
+                value = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.undo()
+            if value > best:
+                best, best_move = value, move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+        flag = -1 if best <= original_alpha else (1 if best >= beta else 0)
+        self.table[game.hash] = (depth, flag, best, best_move)
+        return best
+
+    def search(self, game):
+        """Return (cell, stats) for the side to move."""
+        started = time.perf_counter()
+        self.deadline = started + self.time_budget
+        self.nodes = 0
+        moves = self._ordered(game, None)
+        best_move, best_value, depth_done = (moves[0] if moves else None), None, 0
+        # An immediate win needs no search
+        for move in moves:
+            if game.wins_with(move, game.turn):
+                moves = []
+                best_move, best_value = move, WIN_SCORE
+                break
+        limit = self.max_depth or len(game.cells) - len(game.moves)
+        depth = 1
+        while moves and depth <= limit:
+            try:
+                value = self._negamax(game, depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+            except SearchTimeout:
+                break
+            depth_done = depth
+            best_value = value
+            best_move = self.table[game.hash][3]
+            if self.progress is not None:
+                self.progress.update(depth=depth, nodes=self.nodes, move=best_move)
+            if abs(value) >= WIN_SCORE - len(game.cells):
+                break
+            depth += 1
+        return best_move, {
+            "depth": depth_done,
+            "nodes": self.nodes,
+            "score": best_value,
+            "seconds": time.perf_counter() - started,
+        }
+
+
+# ----- Strategies -----
+
+def random_move(game, rng=random):
+    return rng.choice(game.legal_moves())
+
+
+def greedy_move(game, rng=random):
+    """Win if possible, else block, else take the centre, a corner or a nearby cell."""
+    me = game.turn
+    moves = game.legal_moves()
+    for player in (me, 1 - me):
+        for cell in moves:
+            if game.wins_with(cell, player):
+                return cell
+    center = (game.size // 2) * game.size + game.size // 2
+    if game.cells[center] is None:
+        return center
+    if game.size == 3:
+        corners = [c for c in (0, 2, 6, 8) if game.cells[c] is None]
+        if corners:
+            return rng.choice(corners)
+    return rng.choice(game.candidate_moves() or moves)
+
+
+def best_move(game, time_budget=1.0, stop=None, progress=None):
+    """Perfect play on 3x3, otherwise a time-limited search; returns (cell, stats)."""
+    if game.size == 3 and game.win_length == 3:
+        x_mask = sum(1 << i for i, v in enumerate(game.cells) if v == 0)
+        o_mask = sum(1 << i for i, v in enumerate(game.cells) if v == 1)
+        me, them = (x_mask, o_mask) if game.turn == 0 else (o_mask, x_mask)
+        before = solver.nodes
+        row, col = solver.best_move(me, them)
+        return row * 3 + col, {"depth": 9 - len(game.moves), "nodes": solver.nodes - before}
+    return Searcher(time_budget, stop=stop, progress=progress).search(game)
@@ -0,0 +1,110 @@
+"""Persistent tic-tac-toe game history backed by SQLite.
+
+Each finished game is one row holding its settings, result and move list.
+Moves are stored as a string of fixed-width base-62 cell indices (one
+character per move on boards of up to 62 cells, two above that), so a 3x3
+game such as centre, corner, corner is just "408".  The statistics are
+SQL aggregates and never load the whole history into memory.
+"""
+
+import sqlite3
+import string
+import time
+
+ALPHABET = string.digits + string.ascii_lowercase + string.ascii_uppercase
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    difficulty TEXT,
+    board_size INTEGER NOT NULL,
+    win_length INTEGER NOT NULL,
+    winner TEXT NOT NULL,
+    move_count INTEGER NOT NULL,
+    moves TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_board ON games (board_size, win_length);
+CREATE INDEX IF NOT EXISTS games_by_difficulty ON games (mode, difficulty);
+"""
+
+
+def move_width(cells):
+    return 1 if cells <= len(ALPHABET) else 2
+
+
+def encode_moves(moves, cells):
+    base = len(ALPHABET)
+    if move_width(cells) == 1:
+        return "".join(ALPHABET[m] for m in moves)
+    return "".join(ALPHABET[m // base] + ALPHABET[m % base] for m in moves)
+
+
+def decode_moves(text, cells):
+    width = move_width(cells)
+    base = len(ALPHABET)
+    moves = []
+    for i in range(0, len(text), width):
+        value = 0
+        for ch in text[i:i + width]:
+            value = value * base + ALPHABET.index(ch)
+        moves.append(value)
+    return moves
+
+
+class GameHistory:
+    def __init__(self, path="game_history.db"):
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def record(self, winner, moves, board_size=3, win_length=3, mode="two_player",
+               difficulty=None, played_at=None):
+        """Append one finished game; winner is "X", "O" or "tie", moves are cell indices."""
+        with self.db:
+            self.db.execute(
+                "INSERT INTO games (played_at, mode, difficulty, board_size, win_length,"
+                " winner, move_count, moves) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (played_at or time.strftime("%Y-%m-%d %H:%M"), mode, difficulty, board_size,
+                 win_length, winner, len(moves), encode_moves(moves, board_size * board_size)))
+
+    def clear(self):
+        with self.db:
+            self.db.execute("DELETE FROM games")
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def win_rate_by_difficulty(self):
+        """{difficulty: (games, X wins, O wins, ties)} for single-player games."""
+        rows = self.db.execute(
+            "SELECT difficulty, COUNT(*), SUM(winner = 'X'), SUM(winner = 'O'), SUM(winner = 'tie')"
+            " FROM games WHERE mode = 'single' GROUP BY difficulty ORDER BY difficulty")
+        return {row[0]: row[1:] for row in rows}
+
+    def common_openings(self, board_size=3, win_length=3, plies=1, limit=3):
+        """[(opening moves, games, X win share)] most played first."""
+        cells = board_size * board_size
+        width = move_width(cells)
+        rows = self.db.execute(
+            "SELECT substr(moves, 1, ?) AS opening, COUNT(*), AVG(winner = 'X') FROM games"
+            " WHERE board_size = ? AND win_length = ? AND move_count >= ?"
+            " GROUP BY opening ORDER BY COUNT(*) DESC LIMIT ?",
+            (plies * width, board_size, win_length, plies, limit))
+        return [(decode_moves(opening, cells), games, share) for opening, games, share in rows]
+
+    def average_length(self):
+        """{(board size, win length): average moves per game}."""
+        rows = self.db.execute(
+            "SELECT board_size, win_length, AVG(move_count) FROM games"
+            " GROUP BY board_size, win_length ORDER BY board_size, win_length")
+        return {(size, k): avg for size, k, avg in rows}
+
+    def recent(self, limit=5):
+        """[(played_at, winner, board size)] newest last."""
+        rows = self.db.execute(
+            "SELECT played_at, winner, board_size FROM games ORDER BY id DESC LIMIT ?", (limit,))
+        return list(reversed(rows.fetchall()))